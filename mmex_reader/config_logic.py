@@ -9,16 +9,22 @@ from pathlib import Path
 
 from mmex_reader.config_model import AppConfig
 
+# Configuration lives in the user's home directory
+CONFIG_DIR: Path = Path.home() / ".mmex_reader"
+DEFAULT_CONFIG_FILE: str = "mmex_config.json"
+
+# Reusable encoders; avoids rebuilding a JSONEncoder on every json.dumps call
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, default=str).encode
+_SAVE_ENCODER = json.JSONEncoder(indent=2, sort_keys=True).encode
+
 
 class ConfigManager:
     """Manages application configuration with file persistence."""
 
-    def __init__(self, config_file: str = "mmex_config.json"):
-        # Use user's home directory for configuration
-        home_dir = Path.home() / ".mmex_reader"
+    def __init__(self, config_file: str = DEFAULT_CONFIG_FILE):
         # Create config directory if it doesn't exist
-        home_dir.mkdir(exist_ok=True, parents=True)
-        self.config_file = home_dir / config_file
+        CONFIG_DIR.mkdir(exist_ok=True, parents=True)
+        self.config_file = CONFIG_DIR / config_file
         self.config = AppConfig()
         # Add a config hash to track changes and prevent unnecessary writes
         self._config_hash = None  # Initialize as None to force a load on first access
@@ -26,29 +32,42 @@ class ConfigManager:
 
     def _calculate_config_hash(self) -> str:
         """Calculate a hash of the current configuration to detect changes."""
-        # Use pickle for faster serialization than JSON if available, otherwise fallback to JSON
-        try:
-            import pickle
-            # Use pickle for faster serialization, then hash the bytes
-            serialized = pickle.dumps(self.config.to_dict(), protocol=pickle.HIGHEST_PROTOCOL)
-            return hashlib.md5(serialized).hexdigest()
-        except Exception:
-            # Fallback to JSON if pickle fails
-            config_dict = self.config.to_dict()
-            # Convert config to a consistent JSON string for hashing
-            config_str = json.dumps(config_dict, sort_keys=True, default=str)
-            # Create hash of the configuration string
-            return hashlib.md5(config_str.encode('utf-8')).hexdigest()
+        # Sorted keys give a consistent string for hashing
+        config_str = _HASH_ENCODER(self.config.to_dict())
+        return hashlib.md5(config_str.encode('utf-8')).hexdigest()
     
+    def _atomic_write_json(self) -> bool:
+        """Write the current configuration to disk atomically.
+
+        Returns:
+            True if the file was written, False otherwise
+        """
+        # Write to a per-process temp file then replace to prevent conflicts
+        tmp_path = self.config_file.with_name(f"{self.config_file.stem}.tmp.{os.getpid()}")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                # Sorted keys keep the file stable between saves
+                f.write(_SAVE_ENCODER(self.config.to_dict()))
+            os.replace(tmp_path, self.config_file)
+            return True
+        except Exception as e:
+            # Attempt cleanup of temp file on failure
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except Exception:
+                pass
+            print(f"Error saving config: {e}")
+            return False
+
     def load_config(self) -> None:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.config = AppConfig.from_dict(data)
-                    # Update the hash after loading
-                    self._config_hash = self._calculate_config_hash()
+                # Read the whole file at once; json.loads accepts UTF-8 bytes
+                data = json.loads(self.config_file.read_bytes())
+                self.config = AppConfig.from_dict(data)
+                # Update the hash after loading
+                self._config_hash = self._calculate_config_hash()
             except (json.JSONDecodeError, TypeError, ValueError) as e:
                 # Backup the corrupt/invalid config to preserve user data, then reset to defaults
                 print(f"Error loading config: {e}. Using defaults.")
@@ -67,18 +86,18 @@ class ConfigManager:
         # Load database path from .env if not set in config
         if not self.config.db_file_path:
             try:
-                from mmex_reader.db_utils import load_db_path
-                # Avoid initializing connection pool during config loading to prevent side effects
-                env_db_path = load_db_path(initialize_pool=False)
-                if env_db_path:
-                    old_db_path = self.config.db_file_path
-                    self.config.db_file_path = env_db_path
-                    # Only update the hash if the DB path actually changed
-                    if old_db_path != env_db_path:
-                        self._calculate_config_hash()
+                # The env/.env resolver only; the general resolver consults
+                # config_manager, which may be the instance being built here
+                from mmex_reader.db_connection import _resolve_env_db_path
+                env_db_path = _resolve_env_db_path()
             except ImportError:
-                # Fallback in case db_utils is not available
-                pass
+                # Fallback in case db_connection is not available
+                env_db_path = None
+            if env_db_path and os.path.exists(env_db_path):
+                self.config.db_file_path = env_db_path
+                # Persist once so later launches skip the .env lookup;
+                # save_config only writes when the config hash changed
+                self.save_config()
     
     def save_config(self) -> None:
         """Save configuration to file, only if changes have occurred."""
@@ -88,24 +107,9 @@ class ConfigManager:
             # No changes, skip saving
             return
 
-        try:
-            # Write atomically: write to temp file then replace
-            # Use a more unique temp file name to prevent conflicts
-            tmp_path = self.config_file.with_name(f"{self.config_file.stem}.tmp.{os.getpid()}")
-            with open(tmp_path, 'w', encoding='utf-8') as f:
-                # Use more efficient JSON writing with sorted keys for consistent hashing
-                json.dump(self.config.to_dict(), f, indent=2, sort_keys=True)
-            os.replace(tmp_path, self.config_file)
+        if self._atomic_write_json():
             # Update the hash after successful save
             self._config_hash = current_hash
-        except Exception as e:
-            # Attempt cleanup of temp file on failure
-            try:
-                if 'tmp_path' in locals() and tmp_path.exists():
-                    tmp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-            print(f"Error saving config: {e}")
     
     def get_config(self) -> AppConfig:
         """Get current configuration."""
@@ -135,24 +139,9 @@ class ConfigManager:
     def force_save_config(self) -> None:
         """Force save the configuration even if no changes are detected."""
         current_hash = self._calculate_config_hash()
-        try:
-            # Write atomically: write to temp file then replace
-            # Use a more unique temp file name to prevent conflicts
-            tmp_path = self.config_file.with_name(f"{self.config_file.stem}.tmp.{os.getpid()}")
-            with open(tmp_path, 'w', encoding='utf-8') as f:
-                # Use more efficient JSON writing with sorted keys for consistent hashing
-                json.dump(self.config.to_dict(), f, indent=2, sort_keys=True)
-            os.replace(tmp_path, self.config_file)
+        if self._atomic_write_json():
             # Update the hash after successful save
             self._config_hash = current_hash
-        except Exception as e:
-            # Attempt cleanup of temp file on failure
-            try:
-                if 'tmp_path' in locals() and tmp_path.exists():
-                    tmp_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-            print(f"Error saving config: {e}")
 
     def _validate_updates(self, updates: Dict[str, Any]) -> None:
         """Validate incoming configuration updates and raise on invalid values."""
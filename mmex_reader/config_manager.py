@@ -4,9 +4,50 @@ This module now serves as a clean interface to the configuration system,
 with concerns separated into model, logic, and UI modules.
 """
 
+import threading
+from typing import Optional
+
 from mmex_reader.config_model import AppConfig
 from mmex_reader.config_logic import ConfigManager
 from mmex_reader.config_ui import SettingsPopup
 
-# Global config manager instance to be used across the application
-config_manager = ConfigManager()
+# The shared ConfigManager, built on first use
+_instance: Optional[ConfigManager] = None
+# Serializes construction across threads (the background executors read the
+# config too). Reentrant, so code reached from the constructor on the same
+# thread gets the RuntimeError below instead of deadlocking.
+_instance_lock = threading.RLock()
+# Thread ID while the shared ConfigManager is being built, so code reached
+# from its constructor cannot start building a second one
+_constructing_thread: Optional[int] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return the shared config manager, creating it on first use."""
+    global _instance, _constructing_thread
+    instance = _instance
+    if instance is not None:
+        return instance
+    with _instance_lock:
+        if _instance is None:
+            # Holding the lock, only this thread can be mid-construction
+            if _constructing_thread is not None:
+                raise RuntimeError("config_manager accessed while it is being constructed")
+            _constructing_thread = threading.get_ident()
+            try:
+                _instance = ConfigManager()
+            finally:
+                _constructing_thread = None
+        return _instance
+
+
+def __getattr__(name):
+    # Global config manager instance, constructed lazily so that importing this
+    # module does not touch the config directory or parse the config file.
+    if name == "config_manager":
+        if _constructing_thread == threading.get_ident():
+            # Not available yet to the constructor itself; callers fall back
+            # as if the module had no instance. Other threads wait instead.
+            raise AttributeError(f"module {__name__!r} attribute {name!r} is still being constructed")
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
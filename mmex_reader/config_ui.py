@@ -18,6 +18,33 @@ except Exception:
 
 class SettingsPopup(BasePopup):
     """Settings configuration popup window."""
+
+    # Form layout: (kind, label, config_key[, options]); "section" rows only carry a title
+    _FORM_SCHEMA = (
+        ("section", "Database Settings"),
+        ("file", "Database File:", "db_file_path"),
+        ("section", "UI Settings"),
+        ("int", "Page Size:", "page_size"),
+        ("int", "Font Size:", "default_font_size"),
+        ("spinner", "Theme:", "theme_mode", ("light", "dark")),
+        ("section", "Date Settings"),
+        ("text", "Date Format:", "date_format"),
+        ("int", "Default Range (days):", "default_date_range_days"),
+        ("section", "Performance Settings"),
+        ("switch", "Enable Caching:", "enable_caching"),
+        ("int", "Cache Timeout (min):", "cache_timeout_minutes"),
+        ("int", "Max Cache Size (MB):", "max_cache_size_mb"),
+        ("section", "Export Settings"),
+        ("spinner", "Default Format:", "default_export_format", ("csv", "json", "pdf")),
+        ("dir", "Export Directory:", "export_directory"),
+        ("section", "Chart Settings"),
+        ("spinner", "Default Chart:", "default_chart_type",
+         ("Monthly Spending", "Category Distribution", "Account Balance", "Income vs Expense")),
+        ("spinner", "Color Scheme:", "chart_color_scheme", ("default", "pastel", "bright", "monochrome")),
+    )
+
+    # Config keys entered through integer inputs
+    _INT_KEYS = frozenset(row[2] for row in _FORM_SCHEMA if row[0] == "int")
     
     def __init__(self, config_manager, **kwargs):
         from kivy.uix.boxlayout import BoxLayout
@@ -46,38 +73,12 @@ class SettingsPopup(BasePopup):
         content_layout = GridLayout(cols=2, spacing=10, size_hint_y=None)
         content_layout.bind(minimum_height=content_layout.setter('height'))
         
-        # Database settings
-        self._add_section_header(content_layout, "Database Settings")
-        self._add_file_picker(content_layout, "Database File:", self.config.db_file_path, "db_file_path")
-        
-        # UI settings
-        self._add_section_header(content_layout, "UI Settings")
-        self._add_number_input(content_layout, "Page Size:", str(self.config.page_size), "page_size")
-        self._add_number_input(content_layout, "Font Size:", str(self.config.default_font_size), "default_font_size")
-        self._add_spinner(content_layout, "Theme:", self.config.theme_mode, ["light", "dark"], "theme_mode")
-        
-        # Date settings
-        self._add_section_header(content_layout, "Date Settings")
-        self._add_text_input(content_layout, "Date Format:", self.config.date_format, "date_format")
-        self._add_number_input(content_layout, "Default Range (days):", str(self.config.default_date_range_days), "default_date_range_days")
-        
-        # Performance settings
-        self._add_section_header(content_layout, "Performance Settings")
-        self._add_switch(content_layout, "Enable Caching:", self.config.enable_caching, "enable_caching")
-        self._add_number_input(content_layout, "Cache Timeout (min):", str(self.config.cache_timeout_minutes), "cache_timeout_minutes")
-        self._add_number_input(content_layout, "Max Cache Size (MB):", str(self.config.max_cache_size_mb), "max_cache_size_mb")
-        
-        # Export settings
-        self._add_section_header(content_layout, "Export Settings")
-        self._add_spinner(content_layout, "Default Format:", self.config.default_export_format, ["csv", "json", "pdf"], "default_export_format")
-        self._add_file_picker(content_layout, "Export Directory:", self.config.export_directory, "export_directory", select_dir=True)
-        
-        # Chart settings
-        self._add_section_header(content_layout, "Chart Settings")
-        chart_types = ["Monthly Spending", "Category Distribution", "Account Balance", "Income vs Expense"]
-        self._add_spinner(content_layout, "Default Chart:", self.config.default_chart_type, chart_types, "default_chart_type")
-        color_schemes = ["default", "pastel", "bright", "monochrome"]
-        self._add_spinner(content_layout, "Color Scheme:", self.config.chart_color_scheme, color_schemes, "chart_color_scheme")
+        # Store references to input widgets
+        self.input_widgets = {}
+
+        # Build all settings rows from the declarative form schema
+        for kind, *args in self._FORM_SCHEMA:
+            self._build_row(content_layout, kind, *args)
         
         scroll.add_widget(content_layout)
         main_layout.add_widget(scroll)
@@ -102,9 +103,6 @@ class SettingsPopup(BasePopup):
         self.content = main_layout
         Window.bind(on_key_down=self._on_key_down)
         self.bind(on_dismiss=lambda instance: Window.unbind(on_key_down=self._on_key_down))
-        
-        # Store references to input widgets
-        self.input_widgets = {}
 
     def _on_key_down(self, window, key, scancode, codepoint, modifiers):
         if key == 27:
@@ -115,6 +113,26 @@ class SettingsPopup(BasePopup):
             return True
         return False
     
+    def _build_row(self, layout, kind, *args):
+        """Add one settings row described by a _FORM_SCHEMA entry."""
+        if kind == "section":
+            self._add_section_header(layout, *args)
+            return
+        label_text, config_key, *options = args
+        value = getattr(self.config, config_key)
+        if kind == "int":
+            self._add_number_input(layout, label_text, value, config_key)
+        elif kind == "text":
+            self._add_text_input(layout, label_text, value, config_key)
+        elif kind == "switch":
+            self._add_switch(layout, label_text, value, config_key)
+        elif kind == "spinner":
+            self._add_spinner(layout, label_text, value, list(options[0]), config_key)
+        elif kind in ("file", "dir"):
+            self._add_file_picker(layout, label_text, value, config_key, select_dir=(kind == "dir"))
+        else:
+            raise ValueError(f"Unknown settings row kind: {kind}")
+
     def _add_section_header(self, layout, title):
         from kivy.uix.label import Label
         """Add a section header to the layout."""
@@ -239,8 +257,7 @@ class SettingsPopup(BasePopup):
                 if isinstance(widget, TextInput):
                     value = widget.text
                     # Convert to appropriate type
-                    if key in ['page_size', 'default_font_size', 'default_date_range_days', 
-                              'cache_timeout_minutes', 'max_cache_size_mb']:
+                    if key in self._INT_KEYS:
                         value = int(value) if value.isdigit() else getattr(self.config, key)
                     updates[key] = value
                 elif isinstance(widget, Switch):
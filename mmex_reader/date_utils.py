@@ -0,0 +1,29 @@
+"""Date parsing shared by the MMEX reader package and the legacy Kivy app.
+
+Dependency-free so that mmex_kivy_app_bak.py (imported as a script) and the
+packaged modules validate YYYY-MM-DD strings with the same rules.
+"""
+
+import functools
+import re
+from datetime import datetime
+
+# Standard date format used throughout the application
+DATE_FORMAT: str = "%Y-%m-%d"
+
+# Exact shape of a DATE_FORMAT string: ASCII digits only, so signs, spaces
+# and non-ASCII digits that int() would accept are rejected up front
+_YMD_RE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_ymd(date_str: str) -> datetime:
+    """Parse an exact YYYY-MM-DD string.
+
+    Raises ValueError (like strptime) for a malformed string or an impossible
+    date, and TypeError for non-string input. Form inputs re-validate the same
+    few dates constantly, so results are memoized.
+    """
+    if not _YMD_RE.fullmatch(date_str):
+        raise ValueError(f"time data {date_str!r} does not match format '{DATE_FORMAT}'")
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
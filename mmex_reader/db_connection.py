@@ -1,28 +1,128 @@
 """Database connection management and pooling for the MMEX application."""
 
+import atexit
 import logging
 import os
 import sqlite3
 import threading
-from typing import Dict, Optional, Tuple, Any
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional, Tuple, Any
 from dotenv import load_dotenv
 
+from mmex_reader.db_schema import ACCOUNT_TABLE, TRANSACTION_TABLE, TAGLINK_TABLE
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Configuration constants
 DB_PATH_PRIMARY_ENV: str = "DB_FILE_PATH"
 DB_PATH_SECONDARY_ENV: str = "MMEX_DB_PATH"
+# Opt-in: let the reader write its indexes, planner statistics and WAL mode
+# into the database. Off by default, since the MMEX desktop app owns the file.
+OPTIMIZE_DB_ENV: str = "MMEX_OPTIMIZE_DATABASE"
 DEFAULT_LOG_LEVEL: str = "INFO"
 
 # Connection pool configuration
 MAX_CONNECTIONS: int = 5
 CONNECTION_TIMEOUT: int = 30  # seconds
+# Per-connection prepared-statement cache; the query constants are reused verbatim
+CACHED_STATEMENTS: int = 128
+# Idle connections are only re-probed with SELECT 1 after this many seconds
+CONNECTION_REVALIDATE_SECONDS: float = 60.0
 
 # Default timeouts and retry attempts (previously missing in db_utils.py)
 DEFAULT_QUERY_TIMEOUT: int = 30
 MAX_RETRY_ATTEMPTS: int = 3
 
+# Per-connection tuning applied to every new pooled connection; none of these
+# is stored in the database file
+CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MB
+    "PRAGMA cache_size = -65536",  # 64 MB page cache
+)
+# Persistent: switches the file itself to WAL, so only applied with OPTIMIZE_DB_ENV
+WAL_PRAGMA: str = "PRAGMA journal_mode = WAL"
+# Refuses writes through a pooled connection from then on. With OPTIMIZE_DB_ENV
+# the index and statistics setup has already written by the time it applies;
+# without it the file is opened read-only and is never written at all.
+READ_ONLY_PRAGMA: str = "PRAGMA query_only = ON"
+
+# Indexes backing the account/date range and tag lookups; only created with
+# OPTIMIZE_DB_ENV set
+INDEX_STATEMENTS: Tuple[str, ...] = (
+    f"CREATE INDEX IF NOT EXISTS idx_chk_acc_date ON {TRANSACTION_TABLE}(ACCOUNTID, TRANSDATE)",
+    f"CREATE INDEX IF NOT EXISTS idx_taglink_ref ON {TAGLINK_TABLE}(REFID, REFTYPE)",
+    # Partial indexes over live rows only; used by queries filtering DELETEDTIME = ''
+    f"CREATE INDEX IF NOT EXISTS idx_chk_live_acc_date ON {TRANSACTION_TABLE}(ACCOUNTID, TRANSDATE) WHERE DELETEDTIME = ''",
+    f"CREATE INDEX IF NOT EXISTS idx_chk_live_toacc_date ON {TRANSACTION_TABLE}(TOACCOUNTID, TRANSDATE) WHERE DELETEDTIME = ''",
+    # Date range scans across all accounts (the global transactions view)
+    f"CREATE INDEX IF NOT EXISTS idx_chk_live_date ON {TRANSACTION_TABLE}(TRANSDATE, TRANSID) WHERE DELETEDTIME = ''",
+    # Open-accounts list: STATUS filter plus ACCOUNTNAME ordering
+    f"CREATE INDEX IF NOT EXISTS idx_acct_status_name ON {ACCOUNT_TABLE}(STATUS, ACCOUNTNAME)",
+)
+
+
+def _optimize_database_enabled() -> bool:
+    """Whether OPTIMIZE_DB_ENV is set, in the environment or the .env file."""
+    value = os.getenv(OPTIMIZE_DB_ENV)
+    if value is None:
+        env_file_path = os.path.join(os.path.dirname(__file__), '.env')
+        if os.path.exists(env_file_path):
+            load_dotenv(env_file_path)
+            value = os.getenv(OPTIMIZE_DB_ENV)
+    return (value or "").strip().lower() in ("1", "true", "yes")
+
+
+def _connect(db_path: str, writable: bool) -> sqlite3.Connection:
+    """Open db_path, read-only at the file level unless writable is set."""
+    if writable:
+        target, uri = db_path, False
+    else:
+        target, uri = Path(db_path).resolve().as_uri() + "?mode=ro", True
+    return sqlite3.connect(
+        target,
+        timeout=CONNECTION_TIMEOUT,
+        check_same_thread=False,
+        cached_statements=CACHED_STATEMENTS,
+        uri=uri,
+    )
+
+
+def _apply_pragmas(conn: sqlite3.Connection, optimize: bool = False) -> None:
+    """Apply the connection PRAGMAs, skipping any the database rejects."""
+    pragmas = (CONNECTION_PRAGMAS + (WAL_PRAGMA,)) if optimize else CONNECTION_PRAGMAS
+    for pragma in pragmas:
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not apply '{pragma}': {e}")
+
+
+def _ensure_indexes(conn: sqlite3.Connection) -> None:
+    """Create the query indexes if missing and refresh planner statistics.
+
+    Both are stored in the database file (sqlite_stat1 for the statistics),
+    so this only runs when OPTIMIZE_DB_ENV is set. A full ANALYZE runs only
+    when the database has never been analyzed; afterwards PRAGMA optimize
+    re-analyzes just the tables whose statistics have gone stale. Failures (e.g. a read-only database) are logged and
+    otherwise ignored, since the indexes only affect performance.
+    """
+    try:
+        for statement in INDEX_STATEMENTS:
+            conn.execute(statement)
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        conn.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not create database indexes: {e}")
+
 class DatabaseConfig:
     """Configuration class for database-related settings."""
     
@@ -85,11 +185,31 @@ class ConnectionPool:
             return
             
         self._db_path: Optional[str] = None
-        self._pool: Dict[int, sqlite3.Connection] = {}
-        self._in_use: Dict[int, bool] = {}
+        # Idle connections, most recently released on the right
+        self._idle: Deque[sqlite3.Connection] = deque()
+        self._in_use: Dict[int, sqlite3.Connection] = {}
+        # Checked-out connections handed back by finalizers; drained under the lock
+        self._deferred_releases: Deque[sqlite3.Connection] = deque()
+        self._total: int = 0
+        # Bumped whenever the pool is reset, so a connection opened for a
+        # reservation made before the reset is not counted against the new pool
+        self._generation: int = 0
+        self._last_used: Dict[int, float] = {}
+        self._indexes_ensured: bool = False
+        # OPTIMIZE_DB_ENV, read per initialize(); off means read-only file access
+        self._optimize_db: bool = False
         self._pool_lock: threading.Lock = threading.Lock()
         self._initialized: bool = True
     
+    @property
+    def current_db_path(self) -> Optional[str]:
+        """Database path the pool is serving.
+
+        Only initialize() writes it (under the pool lock); a single attribute
+        read is atomic, so the hot path can check it without locking.
+        """
+        return self._db_path
+
     def initialize(self, db_path: str) -> None:
         if not db_path or not isinstance(db_path, str):
             raise ValueError("Database path must be a non-empty string")
@@ -99,40 +219,93 @@ class ConnectionPool:
             
         with self._pool_lock:
             self._db_path = db_path
+            self._indexes_ensured = False
+            self._optimize_db = _optimize_database_enabled()
             self._close_all_connections()
             logger.info(f"Connection pool initialized with database: {db_path}")
     
     def get_connection(self) -> Optional[sqlite3.Connection]:
         if not self._db_path:
             raise ValueError("Connection pool not initialized with a database path")
-            
-        with self._pool_lock:
-            for conn_id, in_use in self._in_use.items():
-                if not in_use and conn_id in self._pool:
-                    try:
-                        conn = self._pool[conn_id]
-                        conn.execute("SELECT 1")
-                        self._in_use[conn_id] = True
-                        return conn
-                    except sqlite3.Error:
-                        self._remove_connection(conn_id)
-            
-            if len(self._pool) < MAX_CONNECTIONS:
-                try:
-                    conn = sqlite3.connect(
-                        self._db_path,
-                        timeout=CONNECTION_TIMEOUT,
-                        check_same_thread=False
-                    )
-                    conn.execute("PRAGMA foreign_keys = ON")
+
+        while True:
+            # Only pop/reserve under the lock; probing and connecting happen outside it
+            with self._pool_lock:
+                self._drain_deferred_releases()
+                if self._idle:
+                    # LIFO: reuse the most recently released (warmest) connection
+                    conn = self._idle.pop()
                     conn_id = id(conn)
-                    self._pool[conn_id] = conn
-                    self._in_use[conn_id] = True
-                    return conn
-                except sqlite3.Error as e:
-                    logger.error(f"Error creating new connection: {e}")
+                    self._in_use[conn_id] = conn
+                    idle_for = time.monotonic() - self._last_used.get(conn_id, 0.0)
+                    create = False
+                elif self._total < MAX_CONNECTIONS:
+                    self._total += 1
+                    generation = self._generation
+                    db_path = self._db_path
+                    optimize = self._optimize_db
+                    ensure_indexes = optimize and not self._indexes_ensured
+                    if ensure_indexes:
+                        self._indexes_ensured = True
+                    create = True
+                else:
                     return None
+
+            if create:
+                conn = self._create_connection(db_path, optimize, ensure_indexes, generation)
+                if conn is None and self._generation != generation:
+                    continue  # The pool was reset while connecting; reserve again
+                return conn
+
+            # Only probe connections that have been idle for a while
+            if idle_for < CONNECTION_REVALIDATE_SECONDS:
+                return conn
+            try:
+                conn.execute("SELECT 1")
+                return conn
+            except sqlite3.Error:
+                self.discard_connection(conn)
+
+    def _create_connection(self, db_path: str, optimize: bool, ensure_indexes: bool,
+                           generation: int) -> Optional[sqlite3.Connection]:
+        """Open a new connection for a slot reserved in _total during generation.
+
+        Without optimize the file is opened read-only and nothing is written
+        to it; with it, WAL mode and (if ensure_indexes) the indexes are set up
+        before the connection is made query-only.
+
+        Returns None if connecting fails, or if the pool was reset meanwhile
+        (the connection is then closed; the reset already released the slot).
+        """
+        try:
+            conn = _connect(db_path, writable=optimize)
+            _apply_pragmas(conn, optimize)
+            # Indexes are persistent, so create them once per database
+            if ensure_indexes:
+                _ensure_indexes(conn)
+            conn.execute(READ_ONLY_PRAGMA)
+        except sqlite3.Error as e:
+            logger.error(f"Error creating new connection: {e}")
+            with self._pool_lock:
+                if self._generation == generation:
+                    self._total -= 1
+                    if ensure_indexes:
+                        self._indexes_ensured = False
             return None
+
+        with self._pool_lock:
+            stale = self._generation != generation
+            if not stale:
+                conn_id = id(conn)
+                self._in_use[conn_id] = conn
+                self._last_used[conn_id] = time.monotonic()
+        if stale:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            return None
+        return conn
     
     def release_connection(self, conn: Optional[sqlite3.Connection]) -> None:
         if not conn:
@@ -140,45 +313,78 @@ class ConnectionPool:
             
         conn_id = id(conn)
         with self._pool_lock:
-            if conn_id in self._pool and conn_id in self._in_use:
-                self._in_use[conn_id] = False
+            if self._in_use.pop(conn_id, None) is not None:
+                self._last_used[conn_id] = time.monotonic()
+                self._idle.append(conn)
+
+    def release_connection_later(self, conn: sqlite3.Connection) -> None:
+        """Queue a checked-out connection for release without taking the lock.
+
+        For finalizers: garbage collection can run on any thread, including
+        one that already holds the pool lock. The next checkout (or status
+        call) returns the connection to the pool; one the pool no longer
+        tracks, e.g. after close_all(), is ignored.
+        """
+        self._deferred_releases.append(conn)
+
+    def _drain_deferred_releases(self) -> None:
+        """Release the queued connections; caller holds the pool lock."""
+        while self._deferred_releases:
+            conn = self._deferred_releases.popleft()
+            conn_id = id(conn)
+            if self._in_use.pop(conn_id, None) is not None:
+                self._last_used[conn_id] = time.monotonic()
+                self._idle.append(conn)
+
+    def discard_connection(self, conn: Optional[sqlite3.Connection]) -> None:
+        """Close a checked-out connection that failed instead of returning it to the pool."""
+        if not conn:
+            return
+        with self._pool_lock:
+            if self._in_use.pop(id(conn), None) is None:
+                return
+            self._last_used.pop(id(conn), None)
+            self._total -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
     
     def close_all(self) -> None:
         with self._pool_lock:
             self._close_all_connections()
     
     def _close_all_connections(self) -> None:
-        for conn_id, conn in self._pool.items():
+        for conn in list(self._idle) + list(self._in_use.values()):
             try:
                 conn.close()
             except sqlite3.Error:
                 pass
-        self._pool.clear()
+        self._idle.clear()
         self._in_use.clear()
-    
-    def _remove_connection(self, conn_id: int) -> None:
-        if conn_id in self._pool:
-            try:
-                self._pool[conn_id].close()
-            except sqlite3.Error:
-                pass
-            del self._pool[conn_id]
-        if conn_id in self._in_use:
-            del self._in_use[conn_id]
+        self._deferred_releases.clear()
+        self._last_used.clear()
+        self._total = 0
+        self._generation += 1
     
     def get_pool_status(self) -> Dict[str, Any]:
         with self._pool_lock:
-            total_connections = len(self._pool)
-            active_connections = sum(1 for in_use in self._in_use.values() if in_use)
+            self._drain_deferred_releases()
+            total_connections = self._total
+            active_connections = len(self._in_use)
             return {
                 'total_connections': total_connections,
                 'active_connections': active_connections,
-                'available_connections': total_connections - active_connections,
+                'available_connections': len(self._idle),
                 'max_connections': MAX_CONNECTIONS,
                 'database_path': self._db_path
             }
 
 _connection_pool = ConnectionPool()
+atexit.register(_connection_pool.close_all)
+
+# Database path resolved from the environment / .env file, set on first success
+_DB_PATH_CACHE: Optional[str] = None
 
 def _resolve_db_path(preferred_path: Optional[str] = None) -> Optional[str]:
     try:
@@ -191,34 +397,43 @@ def _resolve_db_path(preferred_path: Optional[str] = None) -> Optional[str]:
                 return cfg.db_file_path
         except Exception:
             pass
-        db_path = os.getenv(DB_PATH_PRIMARY_ENV)
-        if db_path:
-            return db_path
-        db_path = os.getenv(DB_PATH_SECONDARY_ENV)
-        if db_path:
-            return db_path
+        return _resolve_env_db_path()
+    except Exception as e:
+        logger.error(f"Error resolving database path: {e}")
+        return None
+
+def _resolve_env_db_path() -> Optional[str]:
+    """Resolve the database path from the environment or .env, caching the result."""
+    global _DB_PATH_CACHE
+    if _DB_PATH_CACHE:
+        return _DB_PATH_CACHE
+    db_path = os.getenv(DB_PATH_PRIMARY_ENV) or os.getenv(DB_PATH_SECONDARY_ENV)
+    if not db_path:
         env_file_path = os.path.join(os.path.dirname(__file__), '.env')
         if os.path.exists(env_file_path):
             load_dotenv(env_file_path)
             db_path = os.getenv(DB_PATH_PRIMARY_ENV) or os.getenv(DB_PATH_SECONDARY_ENV)
-            if db_path:
-                return db_path
-        return None
-    except Exception as e:
-        logger.error(f"Error resolving database path: {e}")
-        return None
+    if db_path and os.path.exists(db_path):
+        _DB_PATH_CACHE = db_path
+    return db_path
+
+def reset_db_path_cache() -> None:
+    """Forget the cached environment database path so it is resolved again."""
+    global _DB_PATH_CACHE
+    _DB_PATH_CACHE = None
 
 def _ensure_pool_for_path(db_path: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
     try:
         resolved_path = _resolve_db_path(db_path)
         if not resolved_path:
             return "Database path not found", None
+        # The file was validated when the pool was initialized for it; only a
+        # path change needs another existence check
+        if _connection_pool.current_db_path == resolved_path:
+            return None, resolved_path
         if not os.path.exists(resolved_path):
             return f"Database file not found: {resolved_path}", None
-        status = _connection_pool.get_pool_status()
-        current_path = status.get('database_path')
-        if current_path != resolved_path:
-            _connection_pool.initialize(resolved_path)
+        _connection_pool.initialize(resolved_path)
         return None, resolved_path
     except Exception as e:
         return str(e), None
@@ -3,19 +3,126 @@
 This file contains the QueryCache class for caching database query results.
 """
 
+import functools
 import logging
 import hashlib
+import os
+import sqlite3
+import sys
 import time
 import threading
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, Optional, Any, Tuple
 from collections import OrderedDict
 
+import pandas as pd
+
+# Contiguous string storage for the TAGS column; pyarrow is optional
+try:
+    import pyarrow  # noqa: F401
+    TAGS_DTYPE = "string[pyarrow]"
+except ImportError:
+    TAGS_DTYPE = "string"
+
+from mmex_reader.db_schema import (
+    Account, ACCOUNT_COLS, ACCOUNT_TABLE, CATEGORY_TABLE, PAYEE_TABLE, TAG_TABLE, TAGLINK_TABLE,
+    TRANSACTION_TABLE, TRANSACTION_NET_AMOUNT_SQL,
+)
+from mmex_reader.db_connection import _connection_pool, _ensure_pool_for_path
+from mmex_reader.error_handling import (
+    DEFAULT_ERROR_MESSAGES, handle_database_query, handle_database_query_row,
+    validate_date_format, validate_date_range,
+)
+
 logger = logging.getLogger(__name__)
 
 # Cache configuration
 DEFAULT_CACHE_TTL_SECONDS = 300  # 5 minutes
 DEFAULT_MAX_CACHE_SIZE = 100
 
+# SQL built once at import time. Each variant below is a complete, fixed
+# string, so the per-connection statement cache reuses its compiled form.
+_SQL_TX_BASE = f"""
+SELECT t.TRANSID,
+       t.TRANSDATE,
+       a.ACCOUNTNAME,
+       p.PAYEENAME,
+       c.CATEGNAME,
+       CASE WHEN t.TRANSCODE = 'Withdrawal' THEN -t.TRANSAMOUNT
+            ELSE t.TRANSAMOUNT END AS TRANSAMOUNT,
+       t.TRANSCODE,
+       t.STATUS,
+       t.NOTES,
+       t.ACCOUNTID AS TRANSACTION_ACCOUNTID,
+       GROUP_CONCAT(tg.TAGNAME, ', ') AS TAGS
+FROM {TRANSACTION_TABLE} t
+LEFT JOIN {ACCOUNT_TABLE} a ON a.ACCOUNTID = t.ACCOUNTID
+LEFT JOIN {PAYEE_TABLE} p ON p.PAYEEID = t.PAYEEID
+LEFT JOIN {CATEGORY_TABLE} c ON c.CATEGID = t.CATEGID
+LEFT JOIN {TAGLINK_TABLE} tl ON tl.REFID = t.TRANSID AND tl.REFTYPE = 'Transaction'
+LEFT JOIN {TAG_TABLE} tg ON tg.TAGID = tl.TAGID
+WHERE t.DELETEDTIME = ''
+  AND t.TRANSDATE >= ?
+  AND t.TRANSDATE < date(?, '+1 day')
+"""
+# TRANSID is unique, so grouping on (TRANSDATE, TRANSID) yields the same
+# groups while letting the live-row date indexes serve GROUP BY and ORDER BY
+_SQL_TX_ORDER = " GROUP BY t.TRANSDATE, t.TRANSID ORDER BY t.TRANSDATE ASC, t.TRANSID ASC"
+_SQL_TX_ALL = _SQL_TX_BASE + _SQL_TX_ORDER
+_SQL_TX_FOR_ACCOUNT = _SQL_TX_BASE + " AND t.ACCOUNTID = ?" + _SQL_TX_ORDER
+
+# Column dtypes for transaction frames, applied directly instead of inferring.
+# TRANSDATE stays text: MMEX stores it as an ISO string, which the grid
+# slices and the charts parse on demand.
+_TX_DTYPES: Dict[str, str] = {
+    "TRANSID": "int64",
+    "TRANSACTION_ACCOUNTID": "int64",
+    "TRANSAMOUNT": "float64",
+}
+
+_SQL_BALANCE = f"""
+SELECT (SELECT INITIALBAL FROM {ACCOUNT_TABLE} WHERE ACCOUNTID = ?)
+       + {TRANSACTION_NET_AMOUNT_SQL}"""
+_SQL_BALANCE_AS_OF = _SQL_BALANCE + " AND t.TRANSDATE < date(?, '+1 day')"
+
+_SQL_OPEN_ACCOUNTS = f"""
+SELECT ACCOUNTID, ACCOUNTNAME, ACCOUNTTYPE, INITIALBAL
+FROM {ACCOUNT_TABLE}
+WHERE STATUS = 'Open'
+ORDER BY ACCOUNTNAME ASC
+"""
+
+
+# Full account record, one column per ACCOUNT_COLS entry in the same order
+_SQL_ACCOUNT_BY_ID = f"""
+SELECT {", ".join(ACCOUNT_COLS.values())}
+FROM {ACCOUNT_TABLE}
+WHERE {ACCOUNT_COLS["id"]} = ?
+"""
+
+# (coerce, default) for each Account field, in ACCOUNT_COLS order; NULL maps
+# to default
+_ACCOUNT_FIELDS = (
+    (int, 0),  # id
+    (str, ""),  # name
+    (str, ""),  # type
+    (float, 0.0),  # initial_balance
+    (str, "FALSE"),  # is_favorite
+    (int, 0),  # currency_id
+    (str, ""),  # status
+    (str, ""),  # notes
+    (str, ""),  # held_at
+    (str, ""),  # website
+    (str, ""),  # contact_info
+    (str, ""),  # access_info
+    (int, 0),  # statement_locked
+    (str, ""),  # statement_date
+    (float, 0.0),  # min_balance
+    (float, 0.0),  # credit_limit
+    (float, 0.0),  # interest_rate
+    (str, ""),  # payment_due_date
+    (float, 0.0),  # min_payment
+)
+
 
 class QueryCache:
     """Thread-safe LRU cache for database query results with TTL support."""
@@ -85,6 +192,11 @@ class QueryCache:
 # Global cache instance
 _query_cache = QueryCache()
 
+# Recent transaction frames, keyed on the database file signature so any
+# write to the file makes older entries unreachable
+TRANSACTIONS_CACHE_SIZE = 16
+_transactions_cache = QueryCache(max_size=TRANSACTIONS_CACHE_SIZE)
+
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get query cache statistics."""
@@ -94,12 +206,15 @@ def get_cache_stats() -> Dict[str, Any]:
 def clear_query_cache() -> None:
     """Clear all cached query results."""
     _query_cache.clear()
+    _transactions_cache.clear()
+    _get_all_accounts_cached.cache_clear()
     logger.info("Query cache cleared")
 
 
 def invalidate_account_cache(account_id: int) -> None:
     """Invalidate cache entries for a specific account."""
     _query_cache.clear()
+    _transactions_cache.clear()
     logger.info(f"Cache invalidated for account {account_id}")
 
 
@@ -114,16 +229,355 @@ def count_transactions_by_date_range(conn, start_date: str, end_date: str) -> in
     pass
 
 
-def get_all_accounts(db_path: str):
-    """Get all open accounts."""
-    pass
+def _connection_is_broken(conn) -> bool:
+    """Return True if a pooled connection can no longer execute statements."""
+    try:
+        conn.execute("SELECT 1")
+        return False
+    except sqlite3.Error:
+        return True
 
 
-def get_account_by_id(db_path: str, account_id: int):
-    """Get account by ID."""
-    pass
+def _db_file_signature(db_path: str) -> Tuple[int, Optional[int]]:
+    """Return the modification times of the database and its WAL file.
 
+    A database in WAL mode (set by MMEX, or by the MMEX_OPTIMIZE_DATABASE
+    opt-in) may take writes in the -wal file only until the next checkpoint,
+    so both are part of the signature. That is two stat calls per cached
+    lookup, the price of never serving a result from before a write.
+    Raises FileNotFoundError if the database itself is gone.
+    """
+    db_mtime = os.stat(db_path).st_mtime_ns
+    try:
+        wal_mtime = os.stat(f"{db_path}-wal").st_mtime_ns
+    except OSError:
+        wal_mtime = None
+    return db_mtime, wal_mtime
 
-def calculate_balance_for_account(db_path: str, account_id: int):
-    """Calculate balance for an account."""
-    pass
+
+def _run_pooled_query(query: str, params: Optional[list] = None,
+                      return_dataframe: bool = True,
+                      single_row: bool = False) -> Tuple[Optional[str], Any]:
+    """Run a query on a pooled connection, retrying once on a fresh connection.
+
+    Pooled connections are no longer probed before every checkout, so a query
+    that fails on a dead connection discards it and is retried once. With
+    single_row, only the first row is fetched, as an sqlite3.Row (or None).
+    """
+    for attempt in range(2):
+        conn = _connection_pool.get_connection()
+        if not conn:
+            return "Could not get a database connection from the pool", None
+        discarded = False
+        try:
+            if single_row:
+                error, result = handle_database_query_row(conn, query, params)
+            else:
+                error, result = handle_database_query(conn, query, params, return_dataframe=return_dataframe)
+            if error and attempt == 0 and _connection_is_broken(conn):
+                _connection_pool.discard_connection(conn)
+                discarded = True
+                continue
+            return (error, None) if error else (None, result)
+        finally:
+            if not discarded:
+                _connection_pool.release_connection(conn)
+    return "Could not get a working database connection", None
+
+
+def _build_transactions_query(
+    start_date_str: str,
+    end_date_str: str,
+    account_id: Optional[int] = None,
+) -> Tuple[str, list]:
+    """Pick the transactions SELECT and build its parameters."""
+    if account_id is None:
+        return _SQL_TX_ALL, [start_date_str, end_date_str]
+    return _SQL_TX_FOR_ACCOUNT, [start_date_str, end_date_str, account_id]
+
+
+def _finalize_transactions_frame(transactions_df):
+    """Apply the fixed column dtypes and normalize TAGS of a transactions frame."""
+    transactions_df = transactions_df.astype(_TX_DTYPES, copy=False)
+    transactions_df['TAGS'] = transactions_df['TAGS'].fillna('').astype(TAGS_DTYPE)
+    return transactions_df
+
+
+class _TransactionChunks:
+    """Iterator of transaction DataFrames of at most chunksize rows.
+
+    Holds a checked-out pooled connection with the query already executed.
+    Use it as a context manager (or call close()) so the connection goes back
+    to the pool as soon as the caller is done; running out of rows also
+    releases it. An iterator dropped without closing is handed back by its
+    finalizer through the pool's lock-free deferred release.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, cursor: sqlite3.Cursor, chunksize: int) -> None:
+        self._conn = conn
+        self._columns = [col[0] for col in cursor.description]
+        self._chunksize = chunksize
+        self._cursor: Optional[sqlite3.Cursor] = cursor
+
+    def __enter__(self) -> '_TransactionChunks':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self):
+        if self._cursor is None:
+            raise StopIteration
+        try:
+            rows = self._cursor.fetchmany(self._chunksize)
+        except Exception:
+            self.close()
+            raise
+        if not rows:
+            self.close()
+            raise StopIteration
+        return _finalize_transactions_frame(pd.DataFrame.from_records(rows, columns=self._columns))
+
+    def close(self) -> None:
+        """Stop iterating and return the connection to the pool.
+
+        Safe after the pool was closed (e.g. by the exit hook): the cursor's
+        closed connection is ignored and the pool no longer tracks it.
+        """
+        cursor, self._cursor = self._cursor, None
+        if cursor is not None:
+            try:
+                cursor.close()
+            except sqlite3.Error:
+                pass
+            _connection_pool.release_connection(self._conn)
+
+    def __del__(self) -> None:
+        # Never take the pool lock here, and skip interpreter shutdown, when
+        # the exit hook has already closed every connection
+        if getattr(self, '_cursor', None) is not None and not sys.is_finalizing():
+            self._cursor = None
+            _connection_pool.release_connection_later(self._conn)
+
+
+def _open_transaction_chunks(query: str, params: list, chunksize: int) -> Tuple[Optional[str], Any]:
+    """Check out a connection and run the query, returning a _TransactionChunks."""
+    conn = _connection_pool.get_connection()
+    if not conn:
+        return "Could not get a database connection from the pool", None
+    try:
+        cursor = conn.execute(query, params)
+    except sqlite3.Error as e:
+        logger.error(f"Error querying transactions: {e}")
+        if _connection_is_broken(conn):
+            _connection_pool.discard_connection(conn)
+        else:
+            _connection_pool.release_connection(conn)
+        return f"Database error: {e}", None
+    return None, _TransactionChunks(conn, cursor, chunksize)
+
+
+def get_transactions(
+    db_path: str,
+    start_date_str: str,
+    end_date_str: str,
+    account_id: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Tuple[Optional[str], Any]:
+    """Get transactions within a date range, optionally for a single account.
+
+    Tags are folded into the main query with a LEFT JOIN and GROUP_CONCAT, so
+    the whole result is fetched in one round-trip. Whole-frame results are
+    cached until the database file changes; callers receive a copy.
+
+    Args:
+        db_path: Path to the MMEX database file.
+        start_date_str: Start date string in YYYY-MM-DD format.
+        end_date_str: End date string in YYYY-MM-DD format (inclusive).
+        account_id: Account ID to filter transactions (optional).
+        chunksize: If given, return an iterator of DataFrames with at most
+            this many rows each instead of a single DataFrame (optional).
+            It holds a pooled connection; use it in a ``with`` block or
+            call its close() method when done.
+
+    Returns:
+        Tuple containing:
+            - error_message (str or None): Error message if any, None if successful
+            - transactions_df (DataFrame, iterator of DataFrames, or None): Matching transactions
+    """
+    # validate_date_range skips missing dates, but the query needs both bounds
+    for date_str in (start_date_str, end_date_str):
+        if not date_str:
+            return DEFAULT_ERROR_MESSAGES['invalid_date_string'].format(date_str=date_str), None
+    range_error = validate_date_range(start_date_str, end_date_str)
+    if range_error:
+        return range_error, None
+
+    init_error, resolved_path = _ensure_pool_for_path(db_path)
+    if init_error:
+        return init_error, None
+
+    query, params = _build_transactions_query(start_date_str, end_date_str, account_id)
+    if chunksize:
+        return _open_transaction_chunks(query, params, chunksize)
+
+    try:
+        cache_params = (resolved_path, _db_file_signature(resolved_path), *params)
+        cached_df = _transactions_cache.get(query, cache_params)
+        if cached_df is not None:
+            return None, cached_df.copy()
+
+        error, transactions_df = _run_pooled_query(query, params)
+        if error:
+            return error, None
+        transactions_df = _finalize_transactions_frame(transactions_df)
+        _transactions_cache.set(query, transactions_df, cache_params)
+        return None, transactions_df.copy()
+    except FileNotFoundError:
+        logger.error(f"Database file not found: {resolved_path}")
+        return f"Database file not found: {resolved_path}", None
+    except Exception as e:
+        logger.error(f"Unexpected error getting transactions: {e}")
+        return f"Unexpected error: {e}", None
+
+
+class _AccountsQueryError(Exception):
+    """Raised inside the accounts cache so failed lookups are not memoized."""
+
+
+@functools.lru_cache(maxsize=4)
+def _get_all_accounts_cached(db_path: str, signature: Tuple[int, Optional[int]]):
+    """Query the open accounts; memoized per database path and file signature."""
+    error, accounts_df = _run_pooled_query(_SQL_OPEN_ACCOUNTS)
+    if error:
+        raise _AccountsQueryError(error)
+    accounts_df['INITIALBAL'] = pd.to_numeric(accounts_df['INITIALBAL'])
+    return accounts_df
+
+
+def get_all_accounts(db_path: str) -> Tuple[Optional[str], Any]:
+    """Get all open accounts.
+
+    Results are cached until the database file changes on disk; callers get
+    a copy they are free to modify.
+
+    Args:
+        db_path: Path to the MMEX database file.
+
+    Returns:
+        Tuple containing:
+            - error_message (str or None): Error message if any, None if successful
+            - accounts_df (DataFrame or None): Open accounts ordered by name
+    """
+    init_error, resolved_path = _ensure_pool_for_path(db_path)
+    if init_error:
+        return init_error, None
+
+    try:
+        accounts_df = _get_all_accounts_cached(resolved_path, _db_file_signature(resolved_path))
+        return None, accounts_df.copy()
+    except _AccountsQueryError as e:
+        return str(e), None
+    except FileNotFoundError:
+        logger.error(f"Database file not found: {resolved_path}")
+        return f"Database file not found: {resolved_path}", None
+    except Exception as e:
+        logger.error(f"Unexpected error getting accounts: {e}")
+        return f"Unexpected error: {e}", None
+
+
+def get_account_by_id(db_path: str, account_id: int) -> Tuple[Optional[str], Optional[Account]]:
+    """Get a single account by ID.
+
+    Args:
+        db_path: Path to the MMEX database file.
+        account_id: Account ID to look up.
+
+    Returns:
+        Tuple containing:
+            - error_message (str or None): Error message if any, None if successful
+            - account (Account or None): The account record
+    """
+    init_error, _ = _ensure_pool_for_path(db_path)
+    if init_error:
+        return init_error, None
+
+    try:
+        error, row = _run_pooled_query(_SQL_ACCOUNT_BY_ID, [account_id], single_row=True)
+        if error:
+            return error, None
+        if row is None:
+            return f"Account not found: {account_id}", None
+        return None, Account(*[
+            coerce(value) if value is not None else default
+            for value, (coerce, default) in zip(row, _ACCOUNT_FIELDS)
+        ])
+    except Exception as e:
+        logger.error(f"Unexpected error getting account {account_id}: {e}")
+        return f"Unexpected error: {e}", None
+
+
+def calculate_balance_for_account(
+    db_path: str,
+    account_id: int,
+    as_of_date: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[float]]:
+    """Calculate the balance for an account, optionally as of a given date.
+
+    The initial balance and the signed sum of the account's transactions are
+    computed by SQLite in a single aggregate query. Transfers count against
+    the source account and towards the destination account.
+
+    Args:
+        db_path: Path to the MMEX database file.
+        account_id: Account ID to calculate the balance for.
+        as_of_date: Include only transactions up to this YYYY-MM-DD date (optional).
+
+    Returns:
+        Tuple containing:
+            - error_message (str or None): Error message if any, None if successful
+            - balance (float or None): Account balance
+    """
+    if as_of_date:
+        date_error, _ = validate_date_format(as_of_date, "as_of_date")
+        if date_error:
+            return date_error, None
+
+    init_error, resolved_path = _ensure_pool_for_path(db_path)
+    if init_error:
+        return init_error, None
+
+    params = [account_id, account_id, account_id, account_id]
+    if as_of_date:
+        query = _SQL_BALANCE_AS_OF
+        params.append(as_of_date)
+    else:
+        query = _SQL_BALANCE
+
+    try:
+        # Balances are re-requested often for the same account/date; keying on
+        # the path and file signature means a write to the database (or a
+        # different file) never returns a stale balance
+        cache_params = (resolved_path, _db_file_signature(resolved_path), *params)
+        cached_balance = _query_cache.get(query, cache_params)
+        if cached_balance is not None:
+            return None, cached_balance
+
+        error, rows = _run_pooled_query(query, params, return_dataframe=False)
+        if error:
+            return error, None
+        balance = rows[0][0] if rows else None
+        if balance is None:
+            return f"Account not found: {account_id}", None
+        balance = float(balance)
+        _query_cache.set(query, balance, cache_params)
+        return None, balance
+    except FileNotFoundError:
+        logger.error(f"Database file not found: {resolved_path}")
+        return f"Database file not found: {resolved_path}", None
+    except Exception as e:
+        logger.error(f"Unexpected error calculating balance: {e}")
+        return f"Unexpected error: {e}", None
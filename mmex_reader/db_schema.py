@@ -1,6 +1,6 @@
 """Database schema constants for the MMEX application."""
 
-from typing import Dict
+from typing import Dict, NamedTuple
 
 # MMEX database schema constants - Table names
 CATEGORY_TABLE: str = "CATEGORY_V1"
@@ -11,6 +11,22 @@ PAYEE_TABLE: str = "PAYEE_V1"
 TAG_TABLE: str = "TAG_V1"
 TAGLINK_TABLE: str = "TAGLINK_V1"
 
+# Net effect of an account's live transactions on its balance, as a
+# "<sum> FROM ... WHERE ..." tail for a SELECT. Deposits add, withdrawals
+# subtract, and transfers leave the source account and arrive at the
+# destination (as TOTRANSAMOUNT). Binds the account ID three times; append
+# " AND t.TRANSDATE < date(?, '+1 day')" for an as-of-date cutoff.
+TRANSACTION_NET_AMOUNT_SQL: str = f"""COALESCE(SUM(CASE
+             WHEN t.TRANSCODE = 'Deposit' THEN t.TRANSAMOUNT
+             WHEN t.TRANSCODE = 'Withdrawal' THEN -t.TRANSAMOUNT
+             WHEN t.TRANSCODE = 'Transfer' AND t.ACCOUNTID = ? THEN -t.TRANSAMOUNT
+             WHEN t.TRANSCODE = 'Transfer' THEN t.TOTRANSAMOUNT
+             ELSE 0 END), 0)
+FROM {TRANSACTION_TABLE} t
+WHERE t.DELETEDTIME = ''
+  AND (t.ACCOUNTID = ? OR t.TOACCOUNTID = ?)
+"""
+
 # MMEX database schema constants - Account table columns
 ACCOUNT_COLS: Dict[str, str] = {
     "id": "ACCOUNTID",
@@ -33,3 +49,31 @@ ACCOUNT_COLS: Dict[str, str] = {
     "payment_due_date": "PAYMENTDUEDATE",
     "min_payment": "MINIMUMPAYMENT"
 }
+
+
+class Account(NamedTuple):
+    """One account record, with fields in ACCOUNT_COLS order.
+
+    A NamedTuple stores its values inline with no per-instance dict; use
+    _asdict() where a mapping is needed.
+    """
+
+    id: int
+    name: str
+    type: str
+    initial_balance: float
+    is_favorite: str
+    currency_id: int
+    status: str
+    notes: str
+    held_at: str
+    website: str
+    contact_info: str
+    access_info: str
+    statement_locked: int
+    statement_date: str
+    min_balance: float
+    credit_limit: float
+    interest_rate: float
+    payment_due_date: str
+    min_payment: float
@@ -6,10 +6,10 @@ This module is now a bridge that imports all functionality from modular files.
 from mmex_reader.db_schema import (
     CATEGORY_TABLE, SUBCATEGORY_TABLE, ACCOUNT_TABLE,
     TRANSACTION_TABLE, PAYEE_TABLE, TAG_TABLE, TAGLINK_TABLE,
-    ACCOUNT_COLS
+    ACCOUNT_COLS, Account
 )
 from mmex_reader.db_connection import (
-    _connection_pool, _ensure_pool_for_path, load_db_path,
+    _connection_pool, _ensure_pool_for_path, load_db_path, reset_db_path_cache,
     DatabaseConfig, _db_config, ConnectionPool
 )
 from mmex_reader.db_queries import (
@@ -23,7 +23,8 @@ from mmex_reader.db_queries import (
 __all__ = [
     'CATEGORY_TABLE', 'SUBCATEGORY_TABLE', 'ACCOUNT_TABLE',
     'TRANSACTION_TABLE', 'PAYEE_TABLE', 'TAG_TABLE', 'TAGLINK_TABLE',
-    'ACCOUNT_COLS', '_connection_pool', '_ensure_pool_for_path', 'load_db_path',
+    'ACCOUNT_COLS', 'Account', '_connection_pool', '_ensure_pool_for_path', 'load_db_path',
+    'reset_db_path_cache',
     'DatabaseConfig', '_db_config', 'ConnectionPool',
     'get_all_accounts', 'get_account_by_id', 'get_transactions',
     'calculate_balance_for_account',
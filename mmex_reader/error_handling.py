@@ -10,6 +10,7 @@ Classes:
 Functions:
     handle_database_operation: Generic database operation handler with consistent error handling
     handle_database_query: Execute database queries with error handling and result formatting
+    handle_database_query_row: Execute a query and fetch only its first row
     validate_date_format: Validate date string format against YYYY-MM-DD pattern
     validate_date_range: Validate that start date is not after end date
 
@@ -19,18 +20,24 @@ Constants:
 """
 
 # Standard library imports
+import functools
 import logging
 import sqlite3
+import time
 from datetime import datetime
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 # Third-party imports
 import pandas as pd
 
+# Local imports
+from mmex_reader.date_utils import DATE_FORMAT, parse_ymd
+
 # Module exports
 __all__ = [
     'handle_database_operation',
     'handle_database_query', 
+    'handle_database_query_row',
     'validate_date_format',
     'validate_date_range',
     'is_valid_date_format',
@@ -51,21 +58,25 @@ logger = logging.getLogger(__name__)
 # MODULE CONSTANTS
 # =============================================================================
 
-# Date format constants
-DATE_FORMAT: str = "%Y-%m-%d"
+# Database errors reported as 'database_error'; pandas' SQL errors are kept
+# for operations that read through pandas
+_DATABASE_ERRORS = (sqlite3.Error, pd.io.sql.DatabaseError)
+
+# Queries slower than this are logged as warnings
+SLOW_QUERY_THRESHOLD_SECONDS: float = 1.0
+
+# Currency symbols and thousands separators stripped from amount strings
+_AMOUNT_STRIP = str.maketrans('', '', '$,')
 
-# Debug message constants
+# Debug message constants (%-style, formatted lazily by logging)
 DEBUG_MSG_OPERATION_SUCCESS = "Database operation completed successfully"
-DEBUG_MSG_QUERY_SUCCESS_DF = "Query executed successfully, returned {count} rows as DataFrame"
-DEBUG_MSG_QUERY_SUCCESS_LIST = "Query executed successfully, returned {count} rows as list"
-DEBUG_MSG_DATE_VALIDATED = "Successfully validated {name}: {date}"
-DEBUG_MSG_DATE_RANGE_VALID = "Valid date range: {start} to {end}"
-DEBUG_MSG_EMPTY_DATE = "Empty date string provided for {name}"
+DEBUG_MSG_QUERY_SUCCESS_DF = "Query executed successfully, returned %d rows as DataFrame"
+DEBUG_MSG_QUERY_SUCCESS_LIST = "Query executed successfully, returned %d rows as list"
+DEBUG_MSG_DATE_VALIDATED = "Successfully validated %s: %s"
+DEBUG_MSG_DATE_RANGE_VALID = "Valid date range: %s to %s"
+DEBUG_MSG_EMPTY_DATE = "Empty date string provided for %s"
 DEBUG_MSG_SKIP_RANGE_VALIDATION = "One or both dates are empty, skipping range validation"
 
-# Error message constants
-ERROR_MSG_UNEXPECTED_RANGE_VALIDATION = "Unexpected error during date range validation"
-
 # Error message templates
 DEFAULT_ERROR_MESSAGES = {
     # Database operation errors
@@ -90,6 +101,14 @@ DEFAULT_ERROR_MESSAGES = {
     'unexpected_error': "Unexpected error: {error}",
 }
 
+# Bound once: bad imports can fail validate_amount on many rows
+_format_invalid_amount = DEFAULT_ERROR_MESSAGES['invalid_amount_format'].format
+
+
+def _amount_err(field_name: str, amount: Any) -> Tuple[str, None]:
+    """Build the standard validate_amount failure result."""
+    return _format_invalid_amount(field=field_name, value=amount), None
+
 # =============================================================================
 # ERROR HANDLING FUNCTIONS
 # =============================================================================
@@ -129,13 +148,9 @@ def handle_database_operation(operation_func: Callable[..., Any], *args: Any, **
         result = operation_func(*args, **kwargs)
         logger.debug(DEBUG_MSG_OPERATION_SUCCESS)
         return None, result
-    except sqlite3.Error as e:
-        error_msg = DEFAULT_ERROR_MESSAGES['database_error'].format(error=e)
-        logger.error(f"SQLite error in database operation: {e}")
-        return error_msg, None
-    except pd.io.sql.DatabaseError as e:
+    except _DATABASE_ERRORS as e:
         error_msg = DEFAULT_ERROR_MESSAGES['database_error'].format(error=e)
-        logger.error(f"Pandas database error in operation: {e}")
+        logger.error(f"Database error in database operation: {e}")
         return error_msg, None
     except Exception as e:
         error_msg = DEFAULT_ERROR_MESSAGES['unexpected_error'].format(error=e)
@@ -187,51 +202,97 @@ def handle_database_query(conn: sqlite3.Connection, query: str, params: Optional
         return error_msg, pd.DataFrame() if return_dataframe else []
 
     # Track query execution time for performance monitoring
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
+
+    def _fail(error_key: str, kind: str, e: Exception):
+        execution_time = time.perf_counter() - start_time
+        logger.error(f"{kind} executing query (execution time: {execution_time:.2f}s): {e}")
+        return DEFAULT_ERROR_MESSAGES[error_key].format(error=e), pd.DataFrame() if return_dataframe else []
 
     try:
-        if return_dataframe:
-            result = pd.read_sql_query(query, conn, params=params or [])
-            execution_time = time.time() - start_time
-            logger.debug(DEBUG_MSG_QUERY_SUCCESS_DF.format(count=len(result)))
-            if execution_time > 1.0:  # Log slow queries (taking more than 1 second)
+        cursor = None
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params or [])
+            rows = cursor.fetchall()
+            if return_dataframe:
+                # Build the frame directly from the rows, bypassing pandas' SQL layer
+                columns = [col[0] for col in cursor.description or ()]
+                result = pd.DataFrame.from_records(rows, columns=columns)
+                debug_msg = DEBUG_MSG_QUERY_SUCCESS_DF
+            else:
+                result = rows
+                debug_msg = DEBUG_MSG_QUERY_SUCCESS_LIST
+            execution_time = time.perf_counter() - start_time
+            logger.debug(debug_msg, len(result))
+            if execution_time > SLOW_QUERY_THRESHOLD_SECONDS:
                 logger.warning(f"Slow query detected (execution time: {execution_time:.2f}s): {query[:100]}...")
             return None, result
-        else:
-            cursor = None
+        finally:
+            # Ensure cursor is closed to avoid resource leaks
             try:
-                cursor = conn.cursor()
-                cursor.execute(query, params or [])
-                result = cursor.fetchall()
-                execution_time = time.time() - start_time
-                logger.debug(DEBUG_MSG_QUERY_SUCCESS_LIST.format(count=len(result)))
-                if execution_time > 1.0:  # Log slow queries (taking more than 1 second)
-                    logger.warning(f"Slow query detected (execution time: {execution_time:.2f}s): {query[:100]}...")
-                return None, result
-            finally:
-                # Ensure cursor is closed to avoid resource leaks
-                try:
-                    if cursor is not None:
-                        cursor.close()
-                except Exception as close_err:
-                    # Non-critical: log at debug level and continue
-                    logger.debug(f"Non-critical error closing cursor: {close_err}")
+                if cursor is not None:
+                    cursor.close()
+            except Exception as close_err:
+                # Non-critical: log at debug level and continue
+                logger.debug("Non-critical error closing cursor: %s", close_err)
+    except _DATABASE_ERRORS as e:
+        return _fail('database_error', "Database error", e)
+    except Exception as e:
+        return _fail('unexpected_error', "Unexpected error", e)
+
+
+def handle_database_query_row(conn: sqlite3.Connection, query: str,
+                              params: Optional[List[Any]] = None) -> Tuple[Optional[str], Optional[sqlite3.Row]]:
+    """Execute a query and return only its first row.
+
+    Single-record lookups skip DataFrame construction entirely. The row is
+    an sqlite3.Row, so columns can be read by name; the row factory is set
+    on the cursor so the (possibly pooled) connection is left untouched.
+
+    Args:
+        conn (sqlite3.Connection): Database connection object.
+        query (str): SQL query string to execute.
+        params (Optional[List[Any]]): List of query parameters for parameter binding.
+
+    Returns:
+        Tuple containing:
+            - error_message (str or None): Error message if any, None if successful
+            - row (sqlite3.Row or None): First result row, None if there is none
+
+    Example:
+        >>> error, row = handle_database_query_row(conn, "SELECT * FROM accounts WHERE id = ?", [1])
+        >>> if not error and row is not None:
+        ...     print(row["ACCOUNTNAME"])
+    """
+    if not conn:
+        error_msg = DEFAULT_ERROR_MESSAGES['invalid_connection']
+        logger.error(error_msg)
+        return error_msg, None
+
+    if not query or not isinstance(query, str):
+        error_msg = DEFAULT_ERROR_MESSAGES['invalid_query'].format(query=query)
+        logger.error(error_msg)
+        return error_msg, None
+
+    cursor = None
+    try:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(query, params or [])
+        return None, cursor.fetchone()
     except sqlite3.Error as e:
-        execution_time = time.time() - start_time
-        error_msg = DEFAULT_ERROR_MESSAGES['database_error'].format(error=e)
-        logger.error(f"SQLite error executing query (execution time: {execution_time:.2f}s): {e}")
-        return error_msg, pd.DataFrame() if return_dataframe else []
-    except pd.io.sql.DatabaseError as e:
-        execution_time = time.time() - start_time
-        error_msg = DEFAULT_ERROR_MESSAGES['database_error'].format(error=e)
-        logger.error(f"Pandas database error executing query (execution time: {execution_time:.2f}s): {e}")
-        return error_msg, pd.DataFrame() if return_dataframe else []
+        logger.error(f"SQLite error executing query: {e}")
+        return DEFAULT_ERROR_MESSAGES['database_error'].format(error=e), None
     except Exception as e:
-        execution_time = time.time() - start_time
-        error_msg = DEFAULT_ERROR_MESSAGES['unexpected_error'].format(error=e)
-        logger.error(f"Unexpected error executing query (execution_time: {execution_time:.2f}s): {e}")
-        return error_msg, pd.DataFrame() if return_dataframe else []
+        logger.error(f"Unexpected error executing query: {e}")
+        return DEFAULT_ERROR_MESSAGES['unexpected_error'].format(error=e), None
+    finally:
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception as close_err:
+                logger.debug("Non-critical error closing cursor: %s", close_err)
 
 
 def validate_date_format(date_str: str, date_name: str = "date") -> Tuple[Optional[str], Optional[datetime]]:
@@ -260,7 +321,7 @@ def validate_date_format(date_str: str, date_name: str = "date") -> Tuple[Option
     """
     # Input validation
     if not date_str:
-        logger.debug(DEBUG_MSG_EMPTY_DATE.format(name=date_name))
+        logger.debug(DEBUG_MSG_EMPTY_DATE, date_name)
         return None, None
         
     if not isinstance(date_str, str):
@@ -274,8 +335,8 @@ def validate_date_format(date_str: str, date_name: str = "date") -> Tuple[Option
         return error_msg, None
         
     try:
-        parsed_date = datetime.strptime(date_str, DATE_FORMAT)
-        logger.debug(DEBUG_MSG_DATE_VALIDATED.format(name=date_name, date=date_str))
+        parsed_date = parse_ymd(date_str)
+        logger.debug(DEBUG_MSG_DATE_VALIDATED, date_name, date_str)
         return None, parsed_date
     except ValueError as e:
         error_msg = DEFAULT_ERROR_MESSAGES['invalid_date_format'].format(
@@ -317,30 +378,25 @@ def validate_date_range(start_date_str: str, end_date_str: str) -> Optional[str]
         return None
         
     # Validate individual date formats first
-    start_error, start_datetime = validate_date_format(start_date_str, "start_date")
+    start_error, _ = validate_date_format(start_date_str, "start_date")
     if start_error:
         return start_error
         
-    end_error, end_datetime = validate_date_format(end_date_str, "end_date")
+    end_error, _ = validate_date_format(end_date_str, "end_date")
     if end_error:
         return end_error
         
-    # Compare dates
-    if start_datetime and end_datetime:
-        if start_datetime > end_datetime:
-            error_msg = DEFAULT_ERROR_MESSAGES['invalid_date_range'].format(
-                start=start_date_str, end=end_date_str
-            )
-            logger.error(f"Date range validation failed: {error_msg}")
-            return error_msg
-            
-        logger.debug(DEBUG_MSG_DATE_RANGE_VALID.format(start=start_date_str, end=end_date_str))
-        return None
+    # Both are validated YYYY-MM-DD strings, whose lexicographic order is
+    # chronological, so they are compared directly
+    if start_date_str > end_date_str:
+        error_msg = DEFAULT_ERROR_MESSAGES['invalid_date_range'].format(
+            start=start_date_str, end=end_date_str
+        )
+        logger.error(f"Date range validation failed: {error_msg}")
+        return error_msg
         
-    # This should not happen if validate_date_format works correctly
-    error_msg = ERROR_MSG_UNEXPECTED_RANGE_VALIDATION
-    logger.error(error_msg)
-    return error_msg
+    logger.debug(DEBUG_MSG_DATE_RANGE_VALID, start_date_str, end_date_str)
+    return None
 
 
 def is_valid_date_format(date_str: str, date_name: str = "date") -> bool:
@@ -385,6 +441,35 @@ def is_valid_date_range(start_date_str: str, end_date_str: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_amount_str(amount_str: str) -> float:
+    """Parse a stripped amount string such as "$1,234.56"; raises ValueError.
+
+    Imported amounts repeat heavily, so results are memoized; '$' and ','
+    are removed in a single translate pass.
+    """
+    return float(amount_str.translate(_AMOUNT_STRIP))
+
+
+def _parse_amount(amount: Any) -> Optional[float]:
+    """Parse a number or amount string to float; None if it is not an amount.
+
+    Does not catch unexpected errors; callers decide whether to log them.
+    """
+    if isinstance(amount, (int, float)):
+        return float(amount)
+
+    if isinstance(amount, str):
+        s = amount.strip()
+        if s:
+            # Allow leading plus/minus and decimal
+            try:
+                return _parse_amount_str(s)
+            except ValueError:
+                pass
+    return None
+
+
 def validate_amount(amount: Any, field_name: str = "amount") -> Tuple[Optional[str], Optional[float]]:
     """Validate and parse amount value into float.
 
@@ -399,35 +484,34 @@ def validate_amount(amount: Any, field_name: str = "amount") -> Tuple[Optional[s
         Tuple[Optional[str], Optional[float]]: (error_message, parsed_float)
     """
     try:
-        if amount is None:
-            return DEFAULT_ERROR_MESSAGES['invalid_amount_format'].format(field=field_name, value=amount), None
-
-        if isinstance(amount, (int, float)):
-            return None, float(amount)
-
-        if isinstance(amount, str):
-            s = amount.strip()
-            if not s:
-                return DEFAULT_ERROR_MESSAGES['invalid_amount_format'].format(field=field_name, value=amount), None
-            s = s.replace('$', '').replace(',', '')
-            # Allow leading plus/minus and decimal
-            try:
-                return None, float(s)
-            except ValueError:
-                return DEFAULT_ERROR_MESSAGES['invalid_amount_format'].format(field=field_name, value=amount), None
-
-        return DEFAULT_ERROR_MESSAGES['invalid_amount_format'].format(field=field_name, value=amount), None
+        parsed = _parse_amount(amount)
+        if parsed is not None:
+            return None, parsed
+        return _amount_err(field_name, amount)
     except Exception as e:
         err = DEFAULT_ERROR_MESSAGES['unexpected_error'].format(error=e)
         logger.error(err)
         return err, None
 
 
+@functools.lru_cache(maxsize=16384)
+def _is_valid_amount_cached(amount: Any) -> bool:
+    """Memoized validity check for hashable amounts.
+
+    Unexpected errors propagate, and lru_cache does not memoize them, so
+    is_valid_amount logs every occurrence rather than only the first.
+    """
+    return _parse_amount(amount) is not None
+
+
 def is_valid_amount(amount: Any) -> bool:
     """Boolean wrapper for amount validation."""
     try:
-        error, parsed = validate_amount(amount)
-        return error is None and parsed is not None
+        try:
+            return _is_valid_amount_cached(amount)
+        except TypeError:
+            # Unhashable input cannot be memoized
+            return _parse_amount(amount) is not None
     except Exception as e:
         logger.error(DEFAULT_ERROR_MESSAGES['unexpected_error'].format(error=e))
         return False
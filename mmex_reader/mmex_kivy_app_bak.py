@@ -5,6 +5,7 @@ from an MMEX (MoneyManagerEx) database file.
 
 import kivy
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
@@ -23,9 +24,14 @@ from kivy.properties import ObjectProperty, StringProperty
 from kivy.uix.widget import Widget  # For spacer
 from kivy.lang import Builder
 from kivy.graphics import Color, Rectangle # Added for custom background
+import atexit
+import functools
 import os
+import threading
+from pathlib import Path
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 
 from dotenv import load_dotenv
@@ -43,10 +49,33 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 UNICODE_FONT_PATH = "fonts/NotoSansCJKtc-Regular.otf"
 
 # --- MMEX Database Schema Configuration ---
-DB_TABLE_TRANSACTIONS = "CHECKINGACCOUNT_V1"
-DB_TABLE_ACCOUNTS = "ACCOUNTLIST_V1"
-DB_TABLE_PAYEES = "PAYEE_V1"
-DB_TABLE_CATEGORIES = "CATEGORY_V1"
+# Table names and the balance SQL come from the shared schema module so they
+# are defined only once. db_schema and date_utils are dependency-free
+# siblings: imported relatively when this file is loaded as part of the
+# mmex_reader package, and as top-level modules (the script's own directory
+# is on sys.path) when it is run directly.
+if __package__:
+    from .db_schema import (
+        TRANSACTION_TABLE as DB_TABLE_TRANSACTIONS,
+        ACCOUNT_TABLE as DB_TABLE_ACCOUNTS,
+        PAYEE_TABLE as DB_TABLE_PAYEES,
+        CATEGORY_TABLE as DB_TABLE_CATEGORIES,
+        TAG_TABLE as DB_TABLE_TAGS,
+        TAGLINK_TABLE as DB_TABLE_TRANSACTION_TAGS,
+        TRANSACTION_NET_AMOUNT_SQL,
+    )
+    from .date_utils import parse_ymd
+else:
+    from db_schema import (
+        TRANSACTION_TABLE as DB_TABLE_TRANSACTIONS,
+        ACCOUNT_TABLE as DB_TABLE_ACCOUNTS,
+        PAYEE_TABLE as DB_TABLE_PAYEES,
+        CATEGORY_TABLE as DB_TABLE_CATEGORIES,
+        TAG_TABLE as DB_TABLE_TAGS,
+        TAGLINK_TABLE as DB_TABLE_TRANSACTION_TAGS,
+        TRANSACTION_NET_AMOUNT_SQL,
+    )
+    from date_utils import parse_ymd
 DB_FIELD_TRANS_ID = "TRANSID"
 DB_FIELD_TRANS_DATE = "TRANSDATE"
 DB_FIELD_TRANS_NOTES = "NOTES"
@@ -61,10 +90,6 @@ DB_FIELD_PAYEE_ID_PK = "PAYEEID"
 DB_FIELD_PAYEE_NAME = "PAYEENAME"
 DB_FIELD_CATEGORY_ID_PK = "CATEGID"
 DB_FIELD_CATEGORY_NAME = "CATEGNAME"
-DB_TABLE_TAGS = "TAG_V1"  # Confirmed table name for tags
-DB_TABLE_TRANSACTION_TAGS = (
-    "TAGLINK_V1"  # Confirmed linking table for transactions and tags
-)
 DB_FIELD_TAG_ID_PK = "TAGID"
 DB_FIELD_TAG_NAME = "TAGNAME"
 DB_FIELD_TRANSTAG_TRANSID_FK = "REFID"  # FK in TAGLINK_V1 to CHECKINGACCOUNT_V1.TRANSID
@@ -75,27 +100,92 @@ DEFAULT_TEXT_COLOR_ON_LIGHT_BG = (0, 0, 0, 1)  # Black text for light background
 DEFAULT_TEXT_COLOR_ON_DARK_BG = (1, 1, 1, 1)   # White text for dark backgrounds
 GRID_BACKGROUND_GREEN = (0.95, 0.95, 0.95, 1) # A moderately dark green for grid backgrounds
 
+# --- Grid Rendering ---
+GRID_ROWS_PER_FRAME = 200  # Rows added per Kivy frame when filling a grid
+
 
 # --- Database Functions ---
+_DB_PATH_CACHE = None
+
+
 def load_db_path():
+    global _DB_PATH_CACHE
+    if _DB_PATH_CACHE:
+        return _DB_PATH_CACHE
     env_path = os.path.join(SCRIPT_DIR, ".env")
     load_dotenv(dotenv_path=env_path, override=True)
     db_file = os.getenv("DB_FILE_PATH")
+    if db_file and os.path.exists(db_file):
+        _DB_PATH_CACHE = db_file
     return db_file
 
 
+def reset_db_path_cache():
+    global _DB_PATH_CACHE
+    _DB_PATH_CACHE = None
+
+
+# Open connections keyed by (thread id, db file); each thread reuses its own
+_CONN_CACHE = {}
+# Applied once when a cached connection is opened
+_CONN_PRAGMAS = (
+    "PRAGMA cache_size = -20000",  # ~20 MB page cache
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def _get_conn(db_file):
+    """Return this thread's cached connection to db_file, opening it on first use."""
+    key = (threading.get_ident(), db_file)
+    conn = _CONN_CACHE.get(key)
+    if conn is None:
+        # Read-only at the file level: this viewer never modifies the database.
+        # check_same_thread=False only so the exit hook may close it.
+        conn = sqlite3.connect(
+            Path(db_file).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        for pragma in _CONN_PRAGMAS:
+            conn.execute(pragma)
+        _CONN_CACHE[key] = conn
+    return conn
+
+
+def _close_cached_connections():
+    """Close every cached connection; registered to run at interpreter exit."""
+    for conn in list(_CONN_CACHE.values()):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _CONN_CACHE.clear()
+
+
+atexit.register(_close_cached_connections)
+
+
+def _read_sql_frame(conn, query, params=()):
+    """Run a query and build a DataFrame straight from the cursor rows."""
+    cursor = conn.execute(query, params)
+    try:
+        columns = [col[0] for col in cursor.description]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+    finally:
+        cursor.close()
+
+
 def get_all_accounts(db_file):
     """Fetches all account names and IDs from the MMEX database."""
-    conn = None
     try:
-        conn = sqlite3.connect(db_file)
+        conn = _get_conn(db_file)
         query = (
             f"SELECT {DB_FIELD_ACCOUNT_ID_PK} AS ACCOUNTID, "
             f"{DB_FIELD_ACCOUNT_NAME} AS ACCOUNTNAME, "
             f"{DB_FIELD_ACCOUNT_INITIAL_BALANCE} AS INITIALBAL "
             f"FROM {DB_TABLE_ACCOUNTS} ORDER BY {DB_FIELD_ACCOUNT_NAME} ASC;"
         )
-        df = pd.read_sql_query(query, conn)
+        df = _read_sql_frame(conn, query)
         if df.empty:
             return "No accounts found.", None
         return None, df
@@ -103,9 +193,14 @@ def get_all_accounts(db_file):
         return f"Database Error fetching accounts: {e}", None
     except Exception as e:
         return f"An unexpected error occurred fetching accounts: {e}", None
-    finally:
-        if conn:
-            conn.close()
+
+
+def _validate_ymd(date_str):
+    """Return a datetime for a valid YYYY-MM-DD string, or None."""
+    try:
+        return parse_ymd(date_str)
+    except (TypeError, ValueError):
+        return None
 
 
 def get_transactions(db_file, start_date_str, end_date_str, account_id=None):
@@ -113,18 +208,14 @@ def get_transactions(db_file, start_date_str, end_date_str, account_id=None):
     Fetches transactions from the MMEX database within a given date range,
     optionally filtered by account_id.
     """
-    try:
-        datetime.strptime(start_date_str, "%Y-%m-%d")
-        datetime.strptime(end_date_str, "%Y-%m-%d")
-    except ValueError:
+    if _validate_ymd(start_date_str) is None or _validate_ymd(end_date_str) is None:
         return (
             f"Error: Incorrect date format. Please use YYYY-MM-DD. "
             f"Start: {start_date_str}, End: {end_date_str}",
             None,
         )
-    conn = None
     try:
-        conn = sqlite3.connect(db_file)
+        conn = _get_conn(db_file)
         query_parts = [
             f"SELECT acc.{DB_FIELD_ACCOUNT_NAME} AS ACCOUNTNAME,",
             f"trans.{DB_FIELD_TRANS_DATE} AS TRANSDATE,",
@@ -133,36 +224,31 @@ def get_transactions(db_file, start_date_str, end_date_str, account_id=None):
             f"payee.{DB_FIELD_PAYEE_NAME} AS PAYEENAME,",
             f"trans.{DB_FIELD_TRANS_ACCOUNTID_FK} AS TRANSACTION_ACCOUNTID,", # Added for robust filtering
             f"cat.{DB_FIELD_CATEGORY_NAME} AS CATEGNAME,",
-            # Subquery to concatenate all tags for a transaction
-            f"""(
-                SELECT GROUP_CONCAT(tag.{DB_FIELD_TAG_NAME}, ', ')
-                FROM {DB_TABLE_TAGS} AS tag
-                JOIN {DB_TABLE_TRANSACTION_TAGS} AS tt ON tag.{DB_FIELD_TAG_ID_PK} = tt.{DB_FIELD_TRANSTAG_TAGID_FK}
-                WHERE tt.{DB_FIELD_TRANSTAG_TRANSID_FK} = trans.{DB_FIELD_TRANS_ID} AND tt.REFTYPE = 'Transaction'
-            ) AS TAGNAMES""",
+            # Concatenate all tags for a transaction in the same pass
+            f"GROUP_CONCAT(tag.{DB_FIELD_TAG_NAME}, ', ') AS TAGNAMES",
             f"FROM {DB_TABLE_TRANSACTIONS} AS trans",
             f"LEFT JOIN {DB_TABLE_ACCOUNTS} AS acc ON trans.{DB_FIELD_TRANS_ACCOUNTID_FK} = acc.{DB_FIELD_ACCOUNT_ID_PK}",
             f"LEFT JOIN {DB_TABLE_PAYEES} AS payee ON trans.{DB_FIELD_TRANS_PAYEEID_FK} = payee.{DB_FIELD_PAYEE_ID_PK}",
             f"LEFT JOIN {DB_TABLE_CATEGORIES} AS cat ON trans.{DB_FIELD_TRANS_CATEGID_FK} = cat.{DB_FIELD_CATEGORY_ID_PK}",
-            f"WHERE trans.{DB_FIELD_TRANS_DATE} < ? AND trans.{DB_FIELD_TRANS_DATE} >= ?",  # Corrected date range logic
+            f"LEFT JOIN {DB_TABLE_TRANSACTION_TAGS} AS tt ON tt.{DB_FIELD_TRANSTAG_TRANSID_FK} = trans.{DB_FIELD_TRANS_ID} AND tt.REFTYPE = 'Transaction'",
+            f"LEFT JOIN {DB_TABLE_TAGS} AS tag ON tag.{DB_FIELD_TAG_ID_PK} = tt.{DB_FIELD_TRANSTAG_TAGID_FK}",
+            # Upper bound is exclusive: the day after end_date_str, computed by SQLite
+            f"WHERE trans.{DB_FIELD_TRANS_DATE} < date(?, '+1 day') AND trans.{DB_FIELD_TRANS_DATE} >= ?",
         ]
-        end_date_str_p1 = (
-            datetime.strptime(end_date_str, "%Y-%m-%d") + timedelta(days=1)
-        ).strftime("%Y-%m-%d")
-        # Correct order for params based on the SQL:
-        # SQL: ... trans.TRANSDATE < ? (upper bound, end_date_str_p1)
-        #          AND trans.TRANSDATE >= ? (lower bound, start_date_str) ...
-        params = [end_date_str_p1, start_date_str]
+        # The already-validated strings are bound as-is
+        params = [end_date_str, start_date_str]
         if (
             account_id is not None
         ):  # Add condition to filter by account ID in the SQL query if provided.
             query_parts.append(f"AND trans.{DB_FIELD_TRANS_ACCOUNTID_FK} = ?")  # type: ignore
             params.append(account_id)
+        query_parts.append(f"GROUP BY trans.{DB_FIELD_TRANS_ID}")
         query_parts.append(
             f"ORDER BY trans.{DB_FIELD_TRANS_DATE} ASC, trans.{DB_FIELD_TRANS_ID} ASC;"
         )
         query = " ".join(query_parts)
-        df = pd.read_sql_query(query, conn, params=tuple(params))
+        df = _read_sql_frame(conn, query, params)
+        df["TAGNAMES"] = df["TAGNAMES"].fillna("")
         if df.empty:
             return (
                 f"No income/expense records found between {start_date_str} "
@@ -178,9 +264,11 @@ def get_transactions(db_file, start_date_str, end_date_str, account_id=None):
         return f"Pandas SQL Error: {e}", None
     except Exception as e:
         return f"An unexpected error occurred: {e}", None
-    finally:
-        if conn:
-            conn.close()
+
+
+_SQL_BALANCE_DELTA_AS_OF = (
+    "SELECT " + TRANSACTION_NET_AMOUNT_SQL + " AND t.TRANSDATE < date(?, '+1 day')"
+)
 
 
 def get_balance_as_of_date(db_file, account_id, initial_balance, end_date_str):
@@ -188,39 +276,28 @@ def get_balance_as_of_date(db_file, account_id, initial_balance, end_date_str):
     Calculates the balance for an account as of a specific end date.
     The balance is initial_balance + sum of transactions up to and including end_date_str.
     """
-    conn = None
     try:
         # Validate end_date_str format
-        datetime.strptime(end_date_str, "%Y-%m-%d")
-
-        # Calculate end_date + 1 day for query condition (TRANSDATE < end_date_plus_one_day)
-        end_date_str_p1 = (
-            datetime.strptime(end_date_str, "%Y-%m-%d") + timedelta(days=1)
-        ).strftime("%Y-%m-%d")
-
-        conn = sqlite3.connect(db_file)
-        query = f"""
-            SELECT SUM({DB_FIELD_TRANS_AMOUNT})
-            FROM {DB_TABLE_TRANSACTIONS}
-            WHERE {DB_FIELD_TRANS_ACCOUNTID_FK} = ?
-            AND {DB_FIELD_TRANS_DATE} < ?
-        """
-        cursor = conn.cursor()
-        cursor.execute(query, (account_id, end_date_str_p1))
-        result = cursor.fetchone()
+        if _validate_ymd(end_date_str) is None:
+            return f"Invalid date format for balance calculation: {end_date_str}", None
+
+        conn = _get_conn(db_file)
+        # Same signed sum as the package's balance query: transfers count in
+        # both directions and deleted rows are excluded
+        result = conn.execute(
+            _SQL_BALANCE_DELTA_AS_OF,
+            (account_id, account_id, account_id, end_date_str),
+        ).fetchone()
 
         sum_transactions = result[0] if result and result[0] is not None else 0.0
         balance = float(initial_balance) + float(sum_transactions)
         return None, balance
     except sqlite3.Error as e:
         return f"Database error calculating balance: {e}", None
-    except ValueError: # Catches strptime error
-        return f"Invalid date format for balance calculation: {end_date_str}", None
+    except ValueError:  # Catches a non-numeric initial balance
+        return f"Invalid initial balance for balance calculation: {initial_balance}", None
     except Exception as e:
         return f"Unexpected error calculating balance: {e}", None
-    finally:
-        if conn:
-            conn.close()
 
 
 class AccountTabContent(BoxLayout):
@@ -283,7 +360,20 @@ class MMEXAppLayout(BoxLayout):
         self.padding = [10, 10, 10, 10]
         self.spacing = 10
         self.all_transactions_df = None  # Store the globally queried DataFrame
+        # Per-account slices of all_transactions_df, keyed by account ID
+        self._by_account = {}
+        # Lazily queried account rows, keyed by (account ID, start, end) so a
+        # result is only reused for the date range it was queried with
+        self._lazy_by_account = {}
         self.db_file_path = load_db_path()  # Load DB path once
+        # Opt-in (MMEX_LAZY_ACCOUNT_TABS in .env): without a global result,
+        # account tabs query their own rows instead of waiting for one
+        self.lazy_account_tabs = os.getenv("MMEX_LAZY_ACCOUNT_TABS", "").lower() in ("1", "true", "yes")
+        # Bumped per global query so late per-account results are discarded
+        self._query_generation = 0
+        # Queries run on one worker thread so the UI stays responsive; a single
+        # worker keeps results arriving in the order the queries were issued
+        self._query_executor = ThreadPoolExecutor(max_workers=1)
 
         # --- Database Path Display ---
         self.db_path_label = Label(
@@ -395,33 +485,47 @@ class MMEXAppLayout(BoxLayout):
         self.all_transactions_status_label.color = DEFAULT_TEXT_COLOR_ON_DARK_BG
         self.tab_panel.default_tab = self.all_transactions_tab  # Set as default
 
+    def _run_in_background(self, on_done, func, *args):
+        """Run func(*args) on the query worker and hand its result to on_done on the Kivy thread."""
+        future = self._query_executor.submit(func, *args)
+        future.add_done_callback(
+            lambda f: Clock.schedule_once(lambda dt: on_done(f.result()), 0)
+        )
+
     def load_account_specific_tabs(self):
         if not self.db_file_path:
             # Error already shown by db_path_label or initial global query attempt
             return
 
-        error_msg, accounts_df = get_all_accounts(self.db_file_path)
+        self._run_in_background(
+            self._on_accounts_loaded, get_all_accounts, self.db_file_path
+        )
+
+    def _on_accounts_loaded(self, result):
+        """Build one tab per account once get_all_accounts has returned."""
+        error_msg, accounts_df = result
         if error_msg:
             self.show_popup("Error Loading Accounts", error_msg)
             return
 
         if accounts_df is not None and not accounts_df.empty:
-            for index, row in accounts_df.iterrows():
-                account_id = row["ACCOUNTID"]
-                account_name = str(row["ACCOUNTNAME"])
-                
-                # Get initial balance robustly
-                initial_balance = 0.0
-                if DB_FIELD_ACCOUNT_INITIAL_BALANCE in accounts_df.columns:
-                    raw_val = row[DB_FIELD_ACCOUNT_INITIAL_BALANCE]
-                    if pd.notna(raw_val):
-                        try:
-                            initial_balance = float(raw_val)
-                        except ValueError:
-                            print(f"Warning: Could not convert INITIALBAL '{raw_val}' to float for account {account_name}. Defaulting to 0.0.")
-                else:
-                    print(f"Warning: '{DB_FIELD_ACCOUNT_INITIAL_BALANCE}' column not found in {DB_TABLE_ACCOUNTS}. Account balances might assume a zero initial balance.")
-
+            # Convert the whole INITIALBAL column at once instead of per row
+            if DB_FIELD_ACCOUNT_INITIAL_BALANCE in accounts_df.columns:
+                raw_balances = accounts_df[DB_FIELD_ACCOUNT_INITIAL_BALANCE]
+                initial_balances = pd.to_numeric(raw_balances, errors="coerce")
+                bad_values = raw_balances[initial_balances.isna() & raw_balances.notna()]
+                for raw_val in bad_values:
+                    print(f"Warning: Could not convert INITIALBAL '{raw_val}' to float. Defaulting to 0.0.")
+                initial_balances = initial_balances.fillna(0.0).astype(float).tolist()
+            else:
+                print(f"Warning: '{DB_FIELD_ACCOUNT_INITIAL_BALANCE}' column not found in {DB_TABLE_ACCOUNTS}. Account balances might assume a zero initial balance.")
+                initial_balances = [0.0] * len(accounts_df)
+
+            for account_id, account_name, initial_balance in zip(
+                accounts_df["ACCOUNTID"].tolist(),
+                accounts_df["ACCOUNTNAME"].astype(str).tolist(),
+                initial_balances,
+            ):
                 # Use TabbedPanelHeader for consistency if you want to style headers
                 tab_header = TabbedPanelHeader(
                     text=account_name[:25]
@@ -444,6 +548,9 @@ class MMEXAppLayout(BoxLayout):
     ):
         """Helper function to populate a GridLayout with DataFrame data."""
         target_grid.clear_widgets()
+        # Any rows still being added by an earlier populate of this grid stop here
+        render_token = object()
+        target_grid.render_token = render_token
 
         if df is None or df.empty:
             no_data_label = Label(
@@ -480,39 +587,54 @@ class MMEXAppLayout(BoxLayout):
             header_label.bind(size=header_label.setter("text_size"))
             target_grid.add_widget(header_label)
 
-        for index, row in df.iterrows():
-            trans_date_full = str(row["TRANSDATE"])
-            trans_date = (
-                trans_date_full.split("T")[0]
-                if "T" in trans_date_full
-                else trans_date_full
-            )
-            row_data = [
-                trans_date,
-                str(row["ACCOUNTNAME"]) if pd.notna(row["ACCOUNTNAME"]) else "",
-                str(row["PAYEENAME"]) if pd.notna(row["PAYEENAME"]) else "",
-                str(row["CATEGNAME"]) if pd.notna(row["CATEGNAME"]) else "",
-                str(row["NOTES"]) if pd.notna(row["NOTES"]) else "",
-                str(row["TRANSAMOUNT"]),
-                str(row["TAGNAMES"])
-                if pd.notna(row["TAGNAMES"])
-                else "",  # Added Tags data
-            ]
-            for item in row_data:
-                cell_label = Label(
-                    text=item,
-                    size_hint_y=None,
-                    height=30,
-                    color=DEFAULT_TEXT_COLOR_ON_LIGHT_BG,
-                    halign="left",
-                    valign="middle",
+        # Build each display column once, column-wise, instead of per-row Series
+        trans_dates = df["TRANSDATE"].astype(str).str.split("T", n=1).str[0]
+        text_columns = df[["ACCOUNTNAME", "PAYEENAME", "CATEGNAME", "NOTES"]].fillna("").astype(str)
+        amounts = df["TRANSAMOUNT"].astype(str)
+        tag_names = df["TAGNAMES"].fillna("").astype(str)  # Added Tags data
+        rows = list(zip(
+            trans_dates,
+            text_columns["ACCOUNTNAME"],
+            text_columns["PAYEENAME"],
+            text_columns["CATEGNAME"],
+            text_columns["NOTES"],
+            amounts,
+            tag_names,
+        ))
+
+        def add_rows(start, dt=None):
+            # Cell widgets are added a frame's worth at a time, so the first
+            # rows show immediately and large results don't freeze the UI
+            if getattr(target_grid, "render_token", None) is not render_token:
+                return
+            end = start + GRID_ROWS_PER_FRAME
+            for row_data in rows[start:end]:
+                for item in row_data:
+                    cell_label = Label(
+                        text=item,
+                        size_hint_y=None,
+                        height=30,
+                        color=DEFAULT_TEXT_COLOR_ON_LIGHT_BG,
+                        halign="left",
+                        valign="middle",
+                    )
+                    cell_label.bind(size=cell_label.setter("text_size"))
+                    target_grid.add_widget(cell_label)
+            if end < len(rows):
+                if status_label_widget:
+                    status_label_widget.text = (
+                        f"{status_message_prefix} Loading {end} of {len(rows)} records..."
+                    )
+                Clock.schedule_once(functools.partial(add_rows, end), 0)
+            elif status_label_widget:
+                # Only the last frame of the current render reports the result;
+                # a superseded render stops above and leaves the label to the
+                # populate that replaced it
+                status_label_widget.text = (
+                    f"{status_message_prefix} Found {len(rows)} records."
                 )
-                cell_label.bind(size=cell_label.setter("text_size"))
-                target_grid.add_widget(cell_label)
-        if status_label_widget:
-            status_label_widget.text = (
-                f"{status_message_prefix} Found {len(df)} records."
-            )
+
+        add_rows(0)
 
     def run_global_query(self, instance):
         """Handles the global query button press."""
@@ -520,10 +642,7 @@ class MMEXAppLayout(BoxLayout):
         end_date = self.end_date_input.text
 
         # Validate dates early for better UX
-        try:
-            datetime.strptime(start_date, "%Y-%m-%d")
-            datetime.strptime(end_date, "%Y-%m-%d")
-        except ValueError:
+        if _validate_ymd(start_date) is None or _validate_ymd(end_date) is None:
             self.show_popup("Date Error", 
                             f"Invalid date format. Please use YYYY-MM-DD.\nStart: {start_date}, End: {end_date}")
             self.all_transactions_status_label.text = "Error: Invalid date format."
@@ -534,18 +653,27 @@ class MMEXAppLayout(BoxLayout):
             self.all_transactions_status_label.text = "DB Error. Configure .env file."
             return
 
+        self._by_account = {}  # Slices of the previous result are stale
+        self._lazy_by_account = {}
+        self._query_generation += 1
         self.all_transactions_status_label.text = "Status: Querying all transactions..."
         self.all_transactions_grid.clear_widgets()  # Clear previous global results
+        self.all_transactions_grid.render_token = None  # Stop any rows still being added
 
-        # Fetch ALL transactions for the date range (account_id=None)
-        error_message, df = get_transactions(
+        # Fetch ALL transactions for the date range (account_id=None) off the UI thread
+        self._run_in_background(
+            self._on_global_query_done,
+            get_transactions,
             self.db_file_path,
             start_date,
             end_date,
-            account_id=None,
-            # query_tags=True # Potentially add a flag if tag querying is optional
+            None,
         )
 
+    def _on_global_query_done(self, result):
+        """Show the global query result; runs on the Kivy thread."""
+        error_message, df = result
+
         self.all_transactions_df = None  # Reset before assigning
 
         if error_message:
@@ -567,6 +695,10 @@ class MMEXAppLayout(BoxLayout):
 
         if df is not None and not df.empty:
             self.all_transactions_df = df
+            # Split once so tab switches are a dict lookup, not a full-frame mask
+            self._by_account = dict(
+                tuple(df.groupby("TRANSACTION_ACCOUNTID", sort=False))
+            )
             self._populate_grid_with_dataframe(
                 self.all_transactions_grid,
                 self.all_transactions_df,
@@ -646,7 +778,43 @@ class MMEXAppLayout(BoxLayout):
             else:
                 tab_content_widget.balance_label.text = "Balance: DB N/A"
 
-            if self.all_transactions_df is None:
+            # This account's slice of the global result, split by
+            # TRANSACTION_ACCOUNTID after the query, or its own lazy query
+            filtered_df = self._by_account.get(account_id_of_tab)
+
+            if filtered_df is None and self.all_transactions_df is None:
+                if self.lazy_account_tabs and self.db_file_path:
+                    lazy_key = (
+                        account_id_of_tab,
+                        self.start_date_input.text,
+                        self.end_date_input.text,
+                    )
+                    cached_df = self._lazy_by_account.get(lazy_key)
+                    if cached_df is not None:
+                        self._populate_grid_with_dataframe(
+                            tab_content_widget.results_grid,
+                            cached_df,
+                            tab_content_widget.results_label,
+                            f"{account_name_of_tab}:",
+                        )
+                        return
+                    tab_content_widget.results_label.text = (
+                        f"Querying {account_name_of_tab}..."
+                    )
+                    self._run_in_background(
+                        functools.partial(
+                            self._on_account_query_done,
+                            tab_content_widget,
+                            self._query_generation,
+                            lazy_key,
+                        ),
+                        get_transactions,
+                        self.db_file_path,
+                        lazy_key[1],
+                        lazy_key[2],
+                        account_id_of_tab,
+                    )
+                    return
                 tab_content_widget.results_label.text = (
                     f"Perform a global query first for {account_name_of_tab}."
                 )
@@ -654,12 +822,7 @@ class MMEXAppLayout(BoxLayout):
                     tab_content_widget.results_grid, None, None
                 )
             else:
-                # Filter the global DataFrame for this specific account tab.
-                # Filter using TRANSACTION_ACCOUNTID from the DataFrame and the tab's account_id.
-                filtered_df = self.all_transactions_df[
-                    self.all_transactions_df["TRANSACTION_ACCOUNTID"] == account_id_of_tab
-                ]
-
+                # None here means the account has no rows in the global result
                 self._populate_grid_with_dataframe(
                     tab_content_widget.results_grid,
                     filtered_df,
@@ -670,6 +833,30 @@ class MMEXAppLayout(BoxLayout):
             # Some other type of tab content, or content not yet set
             pass
 
+    def _on_account_query_done(self, tab_content_widget, generation, lazy_key, result):
+        """Show a lazily queried account's rows; runs on the Kivy thread."""
+        if generation != self._query_generation:
+            return  # A newer global query has started since this was submitted
+        error_message, df = result
+        account_name = tab_content_widget.account_name
+        if df is not None:
+            self._lazy_by_account[lazy_key] = df
+        if lazy_key[1:] != (self.start_date_input.text, self.end_date_input.text):
+            return  # The dates were edited while this query ran
+        if df is None and error_message and "No income/expense records found" not in error_message:
+            print(f"Error fetching transactions for {account_name}: {error_message}")
+            tab_content_widget.results_label.text = f"{account_name}: Query failed."
+            self._populate_grid_with_dataframe(
+                tab_content_widget.results_grid, None, None
+            )
+            return
+        self._populate_grid_with_dataframe(
+            tab_content_widget.results_grid,
+            df,
+            tab_content_widget.results_label,
+            f"{account_name}:",
+        )
+
     def show_popup(self, title, message):
         """Displays a popup message to the user."""
         popup_layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
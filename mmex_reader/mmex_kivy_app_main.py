@@ -80,17 +80,15 @@ class MMEXKivyApp(App):
 # This allows the file to be run directly
 if __name__ == "__main__":
     print("--- MMEX Database Schema Configuration ---")
-    # We'll print the schema constants from db_utils if available
+    # Print the schema constants from the shared schema module
     try:
-        from db_utils import (
-            DB_TABLE_TRANSACTIONS, DB_TABLE_ACCOUNTS, DB_TABLE_PAYEES, 
-            DB_TABLE_CATEGORIES, DB_TABLE_TAGS, DB_TABLE_TRANSACTION_TAGS,
-            DB_FIELD_TRANS_ID, DB_FIELD_TRANS_DATE, DB_FIELD_TRANS_NOTES,
-            DB_FIELD_TRANS_AMOUNT, DB_FIELD_TRANS_ACCOUNTID_FK, DB_FIELD_TRANS_PAYEEID_FK,
-            DB_FIELD_TRANS_CATEGID_FK, DB_FIELD_ACCOUNT_ID_PK, DB_FIELD_ACCOUNT_NAME,
-            DB_FIELD_ACCOUNT_INITIAL_BALANCE, DB_FIELD_PAYEE_ID_PK, DB_FIELD_PAYEE_NAME,
-            DB_FIELD_CATEGORY_ID_PK, DB_FIELD_CATEGORY_NAME, DB_FIELD_TAG_ID_PK,
-            DB_FIELD_TAG_NAME, DB_FIELD_TRANSTAG_TRANSID_FK, DB_FIELD_TRANSTAG_TAGID_FK
+        from db_schema import (
+            TRANSACTION_TABLE as DB_TABLE_TRANSACTIONS,
+            ACCOUNT_TABLE as DB_TABLE_ACCOUNTS,
+            PAYEE_TABLE as DB_TABLE_PAYEES,
+            CATEGORY_TABLE as DB_TABLE_CATEGORIES,
+            TAG_TABLE as DB_TABLE_TAGS,
+            TAGLINK_TABLE as DB_TABLE_TRANSACTION_TAGS,
         )
         
         print(f"DB_TABLE_TRANSACTIONS: {DB_TABLE_TRANSACTIONS}")
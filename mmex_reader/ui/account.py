@@ -26,6 +26,8 @@ class AccountTabContent(BaseUIComponent):
         self.orientation = 'vertical'
         self.account_id = account_id
         self.account_name = account_name
+        # Last balance shown, so repeated refreshes with the same value are skipped
+        self._last_balance = None
         
         try:
             # Set responsive properties based on screen size
@@ -163,5 +165,8 @@ class AccountTabContent(BaseUIComponent):
     
     def update_balance(self, balance):
         """Update the displayed balance."""
+        if balance == self._last_balance:
+            return
         if hasattr(self, 'balance_label'):
+            self._last_balance = balance
             self.balance_label.text = f"Balance: ${balance:.2f}"
@@ -88,6 +88,11 @@ class SortableHeaderButton(Button):
         self.text = self._get_button_text()
 
 
+# Rows of cell labels a grid keeps for reuse; matches the default page size
+# (AppConfig.page_size), so a normal page never creates labels
+CELL_POOL_MAX_ROWS: int = 50
+
+
 def populate_grid_with_dataframe(
     grid: GridLayout,
     df: pd.DataFrame,
@@ -108,6 +113,13 @@ def populate_grid_with_dataframe(
         # Clear existing widgets
         grid.clear_widgets()
 
+        # The pooled labels were just detached; drop their row dicts so the
+        # pool does not keep the previous page's transactions alive
+        cell_pool = _get_cell_pool(grid)
+        for cell_label in cell_pool:
+            cell_label.row_data = None
+            cell_label.row_click_callback = None
+
         # Determine if we're on mobile based on screen width
         # Default to desktop if Window is not available or logic fails
         try:
@@ -146,33 +158,38 @@ def populate_grid_with_dataframe(
             )
             grid.add_widget(header_btn)
 
+        # Convert all cells to display strings up front instead of boxing
+        # every row into a Series; missing columns and NA values become ""
+        cells = df.reindex(columns=display_headers)
+        cell_rows = cells.astype(object).where(cells.notna(), "").astype(str).to_numpy()
+
+        # Row dicts for the click callback are built once per row, not per cell
+        rows_as_dict = df.to_dict(orient='records') if row_click_callback else None
+
+        cell_height = ui_config.responsive.button_height
+
+        # Cell labels are kept on the grid and reused across repopulates, up
+        # to one page's worth; cells beyond that get labels that are not kept
+        pool_limit = CELL_POOL_MAX_ROWS * len(display_headers)
+        del cell_pool[pool_limit:]
+        needed = min(cell_rows.size, pool_limit)
+        while len(cell_pool) < needed:
+            cell_pool.append(_create_cell_label())
+
         # Add data rows
-        for idx, row in df.iterrows():
-            for header in display_headers:
-                # Get cell value
-                if header in row:
-                    cell_value = str(row[header]) if pd.notna(row[header]) else ""
-                else:
-                    cell_value = ""
-
-                # Create cell widget
-                cell_label = Label(
-                    text=cell_value,
-                    size_hint_y=None,
-                    height=ui_config.responsive.button_height,
-                    halign='left',
-                    valign='middle',
-                    text_size=(None, ui_config.responsive.button_height)
-                )
-                
-                # Bind click event to the entire row
-                if row_click_callback:
-                    # Store row data in the label for access in callback
-                    cell_label.row_data = row.to_dict()
-                    cell_label.bind(on_touch_down=lambda instance, touch: 
-                                   _on_row_touch(instance, touch, row_click_callback) 
-                                   if instance.collide_point(touch.x, touch.y) else False)
-                
+        pool_iter = iter(cell_pool)
+        for row_index, row_values in enumerate(cell_rows):
+            row_data = rows_as_dict[row_index] if row_click_callback else None
+            for cell_value in row_values:
+                cell_label = next(pool_iter, None)
+                if cell_label is None:
+                    cell_label = _create_cell_label()
+                cell_label.text = cell_value
+                cell_label.height = cell_height
+                cell_label.text_size = (None, cell_height)
+                # Row data is read by the touch handler bound at creation
+                cell_label.row_data = row_data
+                cell_label.row_click_callback = row_click_callback
                 grid.add_widget(cell_label)
 
         # Update grid height to accommodate all rows
@@ -183,6 +200,36 @@ def populate_grid_with_dataframe(
         show_popup("Error", f"Failed to populate grid: {e}")
 
 
+def _get_cell_pool(grid: GridLayout) -> List[Label]:
+    """Return the reusable cell labels attached to a grid, creating the list once."""
+    pool = getattr(grid, '_cell_label_pool', None)
+    if pool is None:
+        pool = []
+        grid._cell_label_pool = pool
+    return pool
+
+
+def _create_cell_label() -> Label:
+    """Create a pooled grid cell label with its touch handler bound once."""
+    cell_label = Label(
+        size_hint_y=None,
+        halign='left',
+        valign='middle',
+    )
+    cell_label.row_data = None
+    cell_label.row_click_callback = None
+    cell_label.bind(on_touch_down=_on_cell_touch)
+    return cell_label
+
+
+def _on_cell_touch(instance, touch):
+    """Dispatch a touch on a pooled cell to the row callback it was last given."""
+    callback = instance.row_click_callback
+    if callback and instance.collide_point(touch.x, touch.y):
+        return _on_row_touch(instance, touch, callback)
+    return False
+
+
 def _on_row_touch(instance, touch, callback):
     """Handle touch events on row cells."""
     if instance.collide_point(touch.x, touch.y) and touch.is_double_tap:
@@ -12,13 +12,43 @@ from typing import Optional, Callable, Any, List, Dict
 import datetime
 from datetime import datetime
 import calendar
+import functools
 import logging
 
 from .config import ui_config, HEADER_COLOR
 from .base import BaseUIComponent
 
+try:
+    from mmex_reader.date_utils import parse_ymd
+except ImportError:
+    # ui imported with mmex_reader/ itself on sys.path
+    from date_utils import parse_ymd
+
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=256)
+def _monthcal(year: int, month: int):
+    """Return the (immutable) week rows of a month; the layout never changes."""
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+
+def _fmt_ymd(d) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _validate_ymd(date_str: str) -> Optional[datetime]:
+    """Return the parsed date if date_str is a valid YYYY-MM-DD string, else None."""
+    try:
+        return parse_ymd(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
+_WEEKDAY_HEADERS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
 # =============================================================================
 # POPUP UTILITIES
 # =============================================================================
@@ -88,16 +118,20 @@ def create_popup(title: str, content_widget: Any = None, buttons: Optional[List[
             return True
         return False
     
-    try:
-        Window.bind(on_key_down=_on_key_down)
-        def _cleanup(instance):
-            try:
-                Window.unbind(on_key_down=_on_key_down)
-            except Exception:
-                pass
-        popup.bind(on_dismiss=_cleanup)
-    except Exception:
-        pass
+    # Bind on open rather than at creation so a cached popup keeps ESC support
+    def _bind_keys(instance):
+        try:
+            Window.bind(on_key_down=_on_key_down)
+        except Exception:
+            pass
+
+    def _cleanup(instance):
+        try:
+            Window.unbind(on_key_down=_on_key_down)
+        except Exception:
+            pass
+
+    popup.bind(on_open=_bind_keys, on_dismiss=_cleanup)
 
     return popup
 
@@ -157,7 +191,7 @@ class DatePickerWidget(BaseUIComponent):
         try:
             if initial_date:
                 if isinstance(initial_date, str):
-                    self.current_date = datetime.strptime(initial_date, "%Y-%m-%d")
+                    self.current_date = parse_ymd(initial_date)
                 else:
                     self.current_date = initial_date
             else:
@@ -216,7 +250,7 @@ class DatePickerWidget(BaseUIComponent):
             size_hint=(1, None), 
             height=30
         )
-        for day in ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']:
+        for day in _WEEKDAY_HEADERS:
             label = self.create_label(day, size_hint=(1, 1), bold=True)
             day_headers.add_widget(label)
         self.add_widget(day_headers)
@@ -227,7 +261,14 @@ class DatePickerWidget(BaseUIComponent):
             size_hint=(1, 1), 
             spacing=2
         )
-        self._populate_calendar()
+        # Fixed 6x7 grid of day buttons, reused for every month
+        self._day_btns = []
+        for _ in range(42):
+            day_btn = Button(text='', size_hint=(1, 1))
+            day_btn.bind(on_release=self._on_day_release)
+            self._day_btns.append(day_btn)
+            self.calendar_grid.add_widget(day_btn)
+        self._refresh_calendar()
         self.add_widget(self.calendar_grid)
         
     def _create_footer(self):
@@ -259,45 +300,49 @@ class DatePickerWidget(BaseUIComponent):
         
         self.add_widget(footer_layout)
         
-    def _populate_calendar(self):
-        """Populate the calendar grid with day buttons."""
-        self.calendar_grid.clear_widgets()
-        
+    def _refresh_calendar(self):
+        """Update the day buttons in place for the current month."""
         try:
             # Get calendar data
-            cal = calendar.monthcalendar(self.current_date.year, self.current_date.month)
-            
-            for week in cal:
-                for day in week:
-                    if day == 0:
-                        # Empty cell for days from other months
-                        self.calendar_grid.add_widget(Label(text=''))
-                    else:
-                        # Day button
-                        day_btn = Button(
-                            text=str(day),
-                            size_hint=(1, 1),
-                            background_color=self.ui_config.colors.background
-                        )
-                        
-                        # Highlight selected date
-                        if (day == self.selected_date.day and 
-                            self.current_date.month == self.selected_date.month and
-                            self.current_date.year == self.selected_date.year):
-                            day_btn.background_color = self.ui_config.colors.highlight
-                        
-                        # Highlight today
-                        today = datetime.now()
-                        if (day == today.day and 
-                            self.current_date.month == today.month and
-                            self.current_date.year == today.year):
-                            day_btn.background_color = self.ui_config.colors.header
-                        
-                        day_btn.bind(on_release=lambda btn, d=day: self._select_date(d))
-                        self.calendar_grid.add_widget(day_btn)
+            cal = _monthcal(self.current_date.year, self.current_date.month)
+
+            # Resolve the highlight targets once so each cell is a single comparison
+            today = datetime.now()
+            cur_y, cur_m = self.current_date.year, self.current_date.month
+            is_cur_sel_month = (cur_y == self.selected_date.year and cur_m == self.selected_date.month)
+            is_cur_today_month = (cur_y == today.year and cur_m == today.month)
+            sel_day = self.selected_date.day if is_cur_sel_month else 0
+            today_day = today.day if is_cur_today_month else 0
+            colors = self.ui_config.colors
+            col_bg, col_hl, col_today = colors.background, colors.highlight, colors.header
+
+            days = [day for week in cal for day in week]
+            days.extend([0] * (len(self._day_btns) - len(days)))
+            for day_btn, day in zip(self._day_btns, days):
+                if day == 0:
+                    # Empty cell for days from other months
+                    day_btn.text = ''
+                    day_btn.disabled = True
+                    day_btn.background_color = (0, 0, 0, 0)
+                    continue
+
+                day_btn.text = str(day)
+                day_btn.disabled = False
+                # Today takes precedence over the selected date
+                if day == today_day:
+                    day_btn.background_color = col_today
+                elif day == sel_day:
+                    day_btn.background_color = col_hl
+                else:
+                    day_btn.background_color = col_bg
         except Exception as e:
             logger.error(f"Error populating calendar: {e}")
             show_popup("Error", f"Error creating calendar: {e}", "error")
+
+    def _on_day_release(self, instance):
+        """Select the day shown on a calendar button."""
+        if instance.text:
+            self._select_date(int(instance.text))
                     
     def _prev_month(self, instance):
         """Navigate to previous month."""
@@ -327,7 +372,7 @@ class DatePickerWidget(BaseUIComponent):
         """Update the calendar display."""
         try:
             self.month_year_label.text = self.current_date.strftime("%B %Y")
-            self._populate_calendar()
+            self._refresh_calendar()
         except Exception as e:
             logger.error(f"Error updating calendar display: {e}")
             show_popup("Error", "Error updating calendar", "error")
@@ -336,9 +381,9 @@ class DatePickerWidget(BaseUIComponent):
         """Select a specific date."""
         try:
             self.selected_date = self.current_date.replace(day=day)
-            self._populate_calendar()
+            self._refresh_calendar()
             if self.callback:
-                self.callback(self.selected_date.strftime("%Y-%m-%d"))
+                self.callback(_fmt_ymd(self.selected_date))
         except Exception as e:
             logger.error(f"Error selecting date: {e}")
             show_popup("Error", "Error selecting date", "error")
@@ -351,7 +396,7 @@ class DatePickerWidget(BaseUIComponent):
             self.selected_date = today
             self._update_display()
             if self.callback:
-                self.callback(self.selected_date.strftime("%Y-%m-%d"))
+                self.callback(_fmt_ymd(self.selected_date))
         except Exception as e:
             logger.error(f"Error selecting today: {e}")
             show_popup("Error", "Error selecting today's date", "error")
@@ -363,7 +408,7 @@ class DatePickerWidget(BaseUIComponent):
             
     def get_selected_date(self):
         """Get the currently selected date as a string."""
-        return self.selected_date.strftime("%Y-%m-%d")
+        return _fmt_ymd(self.selected_date)
 
 
 class DatePickerButton(BaseUIComponent):
@@ -374,16 +419,12 @@ class DatePickerButton(BaseUIComponent):
         self.date_change_callback = date_change_callback
         
         # Set initial date with validation
-        try:
+        if initial_date and _validate_ymd(initial_date):
+            self.current_date = initial_date
+        else:
             if initial_date:
-                # Validate date format
-                datetime.strptime(initial_date, "%Y-%m-%d")
-                self.current_date = initial_date
-            else:
-                self.current_date = datetime.now().strftime("%Y-%m-%d")
-        except ValueError as e:
-            logger.warning(f"Invalid initial date format: {initial_date}, using today's date")
-            self.current_date = datetime.now().strftime("%Y-%m-%d")
+                logger.warning(f"Invalid initial date format: {initial_date}, using today's date")
+            self.current_date = _fmt_ymd(datetime.now())
         
         # Create button with responsive styling
         self.button = self.create_button(
@@ -395,18 +436,23 @@ class DatePickerButton(BaseUIComponent):
     def _open_date_picker(self, instance: Any) -> None:
         """Open the date picker popup."""
         try:
-            # Create date picker widget
-            date_picker = DatePickerWidget(
-                initial_date=self.current_date,
-                callback=self._on_date_selected
-            )
-            
-            # Create and show popup
-            self.popup = create_popup(
-                title='Select Date',
-                content=date_picker,
-                size_hint=(0.8, 0.8)
-            )
+            if not hasattr(self, '_cached_picker'):
+                # Build the picker and its popup once and reuse them on later opens
+                self._cached_picker = DatePickerWidget(
+                    initial_date=self.current_date,
+                    callback=self._on_date_selected
+                )
+                self.popup = create_popup(
+                    title='Select Date',
+                    content_widget=self._cached_picker,
+                    size_hint=(0.8, 0.8)
+                )
+            else:
+                # Re-sync the cached picker with the button's current date
+                current = _validate_ymd(self.current_date) or datetime.now()
+                self._cached_picker.current_date = current
+                self._cached_picker.selected_date = current
+                self._cached_picker._update_display()
             self.popup.open()
             
         except Exception as e:
@@ -434,14 +480,14 @@ class DatePickerButton(BaseUIComponent):
     def set_date(self, date_str: str) -> None:
         """Set the date value with validation."""
         try:
-            if date_str:
-                # Validate date format
-                datetime.strptime(date_str, "%Y-%m-%d")
+            if not date_str:
+                return
+            if _validate_ymd(date_str):
                 self.current_date = date_str
                 self.button.text = date_str
-        except ValueError as e:
-            logger.error(f"Invalid date format: {date_str}")
-            self.show_error("Invalid date format")
+            else:
+                logger.error(f"Invalid date format: {date_str}")
+                self.show_error("Invalid date format")
         except Exception as e:
             logger.error(f"Error setting date: {e}")
             self.show_error("Error setting date")
@@ -180,21 +180,17 @@ def create_account_balance_chart(transactions_df):
     # Sort by date
     df = df.sort_values('TRANSDATE')
     
-    # Group by account and calculate cumulative balance for each account
-    accounts = df['ACCOUNTNAME'].unique()
+    # Calculate the cumulative balance for every account in one grouped pass
+    df['CUMULATIVE_BALANCE'] = df.groupby('ACCOUNTNAME', sort=False)['TRANSAMOUNT'].cumsum()
+    account_groups = df.groupby('ACCOUNTNAME', sort=False)
     
     # Create figure and axis
     fig = Figure(figsize=(10, 6), dpi=100)
     ax = fig.add_subplot(111)
     
-    colors = plt.cm.tab10(np.linspace(0, 1, len(accounts)))
+    colors = plt.cm.tab10(np.linspace(0, 1, account_groups.ngroups))
     
-    for account, color in zip(accounts, colors):
-        account_df = df[df['ACCOUNTNAME'] == account].copy()
-        
-        # Calculate cumulative balance
-        account_df['CUMULATIVE_BALANCE'] = account_df['TRANSAMOUNT'].cumsum()
-        
+    for (account, account_df), color in zip(account_groups, colors):
         # Create line chart
         ax.plot(account_df['TRANSDATE'], account_df['CUMULATIVE_BALANCE'], 
                 label=account, color=color, linewidth=2, marker='o', markersize=4)
@@ -137,9 +137,8 @@ def optimize_chart_data(df, max_categories=10, min_amount_threshold=0.01, max_da
             
             # Create optimized dataframe
             df_optimized = df.copy()
-            df_optimized['CATEGORY'] = df_optimized['CATEGORY'].apply(
-                lambda x: x if x in top_categories else 'Other'
-            )
+            categories = df_optimized['CATEGORY']
+            df_optimized['CATEGORY'] = categories.where(categories.isin(top_categories), 'Other')
             
             logger.debug(f"Grouped categories from {len(category_totals)} to {len(top_categories) + ('Other' in df_optimized['CATEGORY'].values)}")
             return df_optimized
@@ -104,6 +104,12 @@ class VisualizationTab(BoxLayout):
     def show_chart(self, transactions_df):
         """Display a chart based on the selected chart type."""
         try:
+            # Cached charts were drawn from the previous frame; new data
+            # invalidates them, so switching chart types on the same data
+            # reuses charts without comparing frame contents
+            if transactions_df is not getattr(self, 'current_df', None):
+                self.cache.clear()
+
             # Store reference to current data
             self.current_df = transactions_df
             
@@ -115,8 +121,8 @@ class VisualizationTab(BoxLayout):
                 self.show_chart_error("No data available for visualization")
                 return
             
-            # Create cache key
-            cache_key = f"{self.current_chart_type}_{hash(str(transactions_df.shape))}"
+            # The cache only holds charts for current_df, so the type is the key
+            cache_key = self.current_chart_type
             
             # Try to get chart from cache
             cached_chart = self.cache.get(cache_key)
@@ -0,0 +1,55 @@
+"""Shared fixtures: a small MMEX database with accounts, payees, tags and transfers."""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+MMEX_SCHEMA = """
+CREATE TABLE ACCOUNTLIST_V1(ACCOUNTID INTEGER PRIMARY KEY, ACCOUNTNAME TEXT,
+    ACCOUNTTYPE TEXT, INITIALBAL REAL, STATUS TEXT, FAVORITEACCT TEXT, CURRENCYID INT);
+CREATE TABLE CHECKINGACCOUNT_V1(TRANSID INTEGER PRIMARY KEY, ACCOUNTID INT,
+    TOACCOUNTID INT, PAYEEID INT, TRANSCODE TEXT, TRANSAMOUNT REAL, STATUS TEXT,
+    TRANSACTIONNUMBER TEXT, NOTES TEXT, CATEGID INT, TRANSDATE TEXT,
+    LASTUPDATEDTIME TEXT, DELETEDTIME TEXT DEFAULT '', FOLLOWUPID INT,
+    TOTRANSAMOUNT REAL, COLOR INT);
+CREATE TABLE PAYEE_V1(PAYEEID INTEGER PRIMARY KEY, PAYEENAME TEXT);
+CREATE TABLE CATEGORY_V1(CATEGID INTEGER PRIMARY KEY, CATEGNAME TEXT, ACTIVE INT, PARENTID INT);
+CREATE TABLE TAG_V1(TAGID INTEGER PRIMARY KEY, TAGNAME TEXT, ACTIVE INT);
+CREATE TABLE TAGLINK_V1(TAGLINKID INTEGER PRIMARY KEY, REFTYPE TEXT, REFID INT, TAGID INT);
+INSERT INTO ACCOUNTLIST_V1 VALUES
+    (1, 'Checking', 'Checking', 100, 'Open', 'TRUE', 1),
+    (2, 'Savings', 'Savings', 50, 'Open', 'FALSE', 1),
+    (3, 'Old', 'Checking', 0, 'Closed', 'FALSE', 1);
+INSERT INTO PAYEE_V1 VALUES (1, 'Shop'), (2, 'Employer');
+INSERT INTO CATEGORY_V1 VALUES (1, 'Food', 1, -1), (2, 'Salary', 1, -1);
+INSERT INTO TAG_V1 VALUES (1, 'a', 1), (2, 'b', 1);
+INSERT INTO CHECKINGACCOUNT_V1
+    (TRANSID, ACCOUNTID, TOACCOUNTID, PAYEEID, TRANSCODE, TRANSAMOUNT, STATUS,
+     NOTES, CATEGID, TRANSDATE, DELETEDTIME, TOTRANSAMOUNT)
+VALUES
+    (1, 1, -1, 1, 'Withdrawal', 10, 'R', 'n1', 1, '2024-01-05', '', 10),
+    (2, 1, -1, 2, 'Deposit', 200, 'R', 'n2', 2, '2024-01-10T09:00:00', '', 200),
+    (3, 1, 2, -1, 'Transfer', 30, 'R', '', -1, '2024-01-15', '', 30),
+    (4, 2, -1, 1, 'Withdrawal', 5, 'R', '', 1, '2024-01-31', '', 5),
+    (5, 1, -1, 1, 'Withdrawal', 999, 'R', '', 1, '2024-01-20', '2024-02-01', 999);
+INSERT INTO TAGLINK_V1 VALUES
+    (1, 'Transaction', 1, 1), (2, 'Transaction', 1, 2),
+    (3, 'Transaction', 2, 2), (4, 'Payee', 3, 1);
+"""
+
+
+@pytest.fixture
+def mmex_db(tmp_path):
+    """Path to a fresh MMEX database; account 1 ends at 260, account 2 at 75."""
+    path = str(tmp_path / "mmex.mmb")
+    conn = sqlite3.connect(path)
+    conn.executescript(MMEX_SCHEMA)
+    conn.commit()
+    conn.close()
+    return path
@@ -0,0 +1,78 @@
+"""The legacy app's balance must agree with the package's balance query."""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mmex_reader.db_queries import calculate_balance_for_account  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE ACCOUNTLIST_V1(ACCOUNTID INTEGER PRIMARY KEY, ACCOUNTNAME TEXT,
+    ACCOUNTTYPE TEXT, INITIALBAL REAL, STATUS TEXT);
+CREATE TABLE CHECKINGACCOUNT_V1(TRANSID INTEGER PRIMARY KEY, ACCOUNTID INT,
+    TOACCOUNTID INT, PAYEEID INT, TRANSCODE TEXT, TRANSAMOUNT REAL, STATUS TEXT,
+    NOTES TEXT, CATEGID INT, TRANSDATE TEXT, DELETEDTIME TEXT DEFAULT '',
+    TOTRANSAMOUNT REAL);
+CREATE TABLE TAGLINK_V1(TAGLINKID INTEGER PRIMARY KEY, REFTYPE TEXT, REFID INT, TAGID INT);
+INSERT INTO ACCOUNTLIST_V1 VALUES
+    (1, 'Checking', 'Checking', 100, 'Open'),
+    (2, 'Savings', 'Savings', 50, 'Open');
+INSERT INTO CHECKINGACCOUNT_V1
+    (TRANSID, ACCOUNTID, TOACCOUNTID, TRANSCODE, TRANSAMOUNT, TRANSDATE, DELETEDTIME, TOTRANSAMOUNT)
+VALUES
+    (1, 1, -1, 'Withdrawal', 10, '2024-01-05', '', 10),
+    (2, 1, -1, 'Deposit', 200, '2024-01-10T09:00:00', '', 200),
+    (3, 1, 2, 'Transfer', 30, '2024-01-15', '', 30),
+    (4, 2, 1, 'Transfer', 25, '2024-01-18', '', 20),
+    (5, 2, -1, 'Withdrawal', 5, '2024-01-31', '', 5),
+    (6, 1, -1, 'Withdrawal', 999, '2024-01-20', '2024-02-01', 999),
+    (7, 1, -1, 'Deposit', 40, '2024-02-03', '', 40);
+"""
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = str(tmp_path / "balance.mmb")
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _import_legacy():
+    pytest.importorskip("kivy")
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    from mmex_reader import mmex_kivy_app_bak as legacy
+    return legacy
+
+
+@pytest.mark.parametrize("account_id, initial_balance", [(1, 100.0), (2, 50.0)])
+@pytest.mark.parametrize("as_of", ["2024-01-15", "2024-01-31", "2024-12-31"])
+def test_legacy_balance_matches_package(db_file, account_id, initial_balance, as_of):
+    legacy = _import_legacy()
+
+    error, expected = calculate_balance_for_account(db_file, account_id, as_of)
+    assert error is None
+    error, balance = legacy.get_balance_as_of_date(db_file, account_id, initial_balance, as_of)
+    assert error is None
+    assert balance == pytest.approx(expected)
+
+
+def test_legacy_queries_leave_database_unmodified(mmex_db):
+    legacy = _import_legacy()
+    error, _ = legacy.get_transactions(mmex_db, "2024-01-01", "2024-12-31", 1)
+    assert error is None
+
+    conn = sqlite3.connect(mmex_db)
+    try:
+        indexes = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    finally:
+        conn.close()
+    assert indexes == []
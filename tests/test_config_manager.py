@@ -0,0 +1,64 @@
+"""The shared config manager is built once, even across threads and re-entry."""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("kivy")
+
+from mmex_reader import config_manager  # noqa: E402
+
+
+@pytest.fixture
+def fresh(monkeypatch):
+    monkeypatch.setattr(config_manager, "_instance", None)
+    return config_manager
+
+
+def test_reentrant_construction_raises(fresh, monkeypatch):
+    class Reentrant:
+        def __init__(self):
+            fresh.get_config_manager()
+
+    monkeypatch.setattr(fresh, "ConfigManager", Reentrant)
+    with pytest.raises(RuntimeError):
+        fresh.get_config_manager()
+    assert fresh._instance is None
+
+
+def test_attribute_is_unavailable_to_its_own_constructor(fresh, monkeypatch):
+    seen = []
+
+    class LooksUpAttribute:
+        def __init__(self):
+            seen.append(getattr(fresh, "config_manager", None))
+
+    monkeypatch.setattr(fresh, "ConfigManager", LooksUpAttribute)
+    instance = fresh.get_config_manager()
+    assert seen == [None]
+    assert fresh.config_manager is instance
+
+
+def test_concurrent_first_use_builds_one_instance(fresh, monkeypatch):
+    built = []
+
+    class Slow:
+        def __init__(self):
+            built.append(self)
+            time.sleep(0.05)
+
+    monkeypatch.setattr(fresh, "ConfigManager", Slow)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(fresh.config_manager))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert len(results) == 8
+    assert all(result is built[0] for result in results)
@@ -0,0 +1,40 @@
+"""parse_ymd accepts exact YYYY-MM-DD dates and nothing int() would also take."""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from mmex_reader.date_utils import parse_ymd  # noqa: E402
+
+
+def test_parses_valid_date():
+    assert parse_ymd("2024-02-29") == datetime(2024, 2, 29)
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "+024-01-01",
+        "2024-01- 1",
+        "2024-01-+1",
+        "2024-1-01",
+        "2024-01-01T00:00",
+        "20240101",
+        "٢٠٢٤-01-01",  # Arabic-Indic digits
+        "2023-02-29",
+        "",
+    ],
+)
+def test_rejects_malformed_or_impossible(date_str):
+    with pytest.raises(ValueError):
+        parse_ymd(date_str)
+
+
+def test_rejects_non_string():
+    with pytest.raises(TypeError):
+        parse_ymd(20240101)
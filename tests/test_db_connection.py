@@ -0,0 +1,178 @@
+"""Connection pool behaviour and database path resolution in db_connection."""
+
+import os
+import sqlite3
+
+import pytest
+
+from mmex_reader import db_connection
+from mmex_reader.db_connection import (
+    DB_PATH_PRIMARY_ENV,
+    DB_PATH_SECONDARY_ENV,
+    OPTIMIZE_DB_ENV,
+    _connection_pool,
+    _resolve_env_db_path,
+    reset_db_path_cache,
+)
+
+
+def _schema_state(path):
+    conn = sqlite3.connect(path)
+    try:
+        names = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' OR name LIKE 'sqlite_stat%'"
+        )]
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    finally:
+        conn.close()
+    return names, journal_mode
+
+
+def test_default_pool_does_not_write_to_database(mmex_db, monkeypatch):
+    monkeypatch.delenv(OPTIMIZE_DB_ENV, raising=False)
+    monkeypatch.setattr(db_connection, "load_dotenv", lambda *a, **k: False)
+    _connection_pool.initialize(mmex_db)
+    conn = _connection_pool.get_connection()
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM ACCOUNTLIST_V1").fetchone()[0] == 3
+    finally:
+        _connection_pool.release_connection(conn)
+        _connection_pool.close_all()
+
+    assert _schema_state(mmex_db) == ([], "delete")
+    assert not os.path.exists(mmex_db + "-wal")
+
+
+def test_opt_in_creates_indexes_and_wal(mmex_db, monkeypatch):
+    monkeypatch.setenv(OPTIMIZE_DB_ENV, "1")
+    _connection_pool.initialize(mmex_db)
+    conn = _connection_pool.get_connection()
+    _connection_pool.release_connection(conn)
+    _connection_pool.close_all()
+
+    names, journal_mode = _schema_state(mmex_db)
+    assert "idx_chk_live_acc_date" in names
+    assert journal_mode == "wal"
+
+
+@pytest.fixture
+def env_path_cache(monkeypatch):
+    monkeypatch.delenv(DB_PATH_PRIMARY_ENV, raising=False)
+    monkeypatch.delenv(DB_PATH_SECONDARY_ENV, raising=False)
+    monkeypatch.setattr(db_connection, "load_dotenv", lambda *a, **k: False)
+    reset_db_path_cache()
+    yield
+    reset_db_path_cache()
+
+
+def test_env_db_path_is_cached_until_reset(tmp_path, monkeypatch, env_path_cache):
+    first = tmp_path / "first.mmb"
+    second = tmp_path / "second.mmb"
+    first.touch()
+    second.touch()
+
+    monkeypatch.setenv(DB_PATH_PRIMARY_ENV, str(first))
+    assert _resolve_env_db_path() == str(first)
+
+    monkeypatch.setenv(DB_PATH_PRIMARY_ENV, str(second))
+    assert _resolve_env_db_path() == str(first)
+
+    reset_db_path_cache()
+    assert _resolve_env_db_path() == str(second)
+
+
+def test_missing_env_db_path_is_not_cached(tmp_path, monkeypatch, env_path_cache):
+    path = tmp_path / "later.mmb"
+    monkeypatch.setenv(DB_PATH_SECONDARY_ENV, str(path))
+    # Returned for the caller to report, but looked up again next time
+    assert _resolve_env_db_path() == str(path)
+    assert db_connection._DB_PATH_CACHE is None
+
+    path.touch()
+    assert _resolve_env_db_path() == str(path)
+    assert db_connection._DB_PATH_CACHE == str(path)
+
+
+@pytest.fixture
+def pool(mmex_db, monkeypatch):
+    monkeypatch.delenv(OPTIMIZE_DB_ENV, raising=False)
+    monkeypatch.setattr(db_connection, "load_dotenv", lambda *a, **k: False)
+    _connection_pool.initialize(mmex_db)
+    yield _connection_pool
+    _connection_pool.close_all()
+
+
+def test_recently_released_connection_is_not_probed(pool):
+    conn = pool.get_connection()
+    pool.release_connection(conn)
+    # A dead connection inside the revalidation window is handed out as is;
+    # the query layer discards it if it then fails
+    conn.close()
+    assert pool.get_connection() is conn
+
+
+def test_long_idle_dead_connection_is_replaced(pool):
+    conn = pool.get_connection()
+    pool.release_connection(conn)
+    conn.close()
+    pool._last_used[id(conn)] -= db_connection.CONNECTION_REVALIDATE_SECONDS + 1
+
+    fresh = pool.get_connection()
+    assert fresh is not conn
+    assert fresh.execute("SELECT 1").fetchone() == (1,)
+    status = pool.get_pool_status()
+    assert (status['total_connections'], status['active_connections']) == (1, 1)
+
+
+def test_discarded_connection_frees_its_slot(pool):
+    conn = pool.get_connection()
+    pool.discard_connection(conn)
+    assert pool.get_pool_status()['total_connections'] == 0
+    # Discarding twice, or a connection the pool never gave out, is ignored
+    pool.discard_connection(conn)
+    assert pool.get_pool_status()['total_connections'] == 0
+
+
+def test_most_recently_released_connection_is_reused_first(pool):
+    first = pool.get_connection()
+    second = pool.get_connection()
+    pool.release_connection(first)
+    pool.release_connection(second)
+    assert pool.get_connection() is second
+    assert pool.get_connection() is first
+
+
+def test_pool_hands_out_at_most_max_connections(pool):
+    held = [pool.get_connection() for _ in range(db_connection.MAX_CONNECTIONS)]
+    assert all(held)
+    assert pool.get_connection() is None
+    pool.release_connection(held.pop())
+    assert pool.get_connection() is not None
+
+
+def test_connection_opened_across_a_reset_is_not_pooled(pool, mmex_db, tmp_path, monkeypatch):
+    other = tmp_path / "other.mmb"
+    source, target = sqlite3.connect(mmex_db), sqlite3.connect(other)
+    source.backup(target)
+    source.close()
+    target.close()
+    apply_pragmas = db_connection._apply_pragmas
+    resets = []
+
+    def reset_while_connecting(conn, *args):
+        apply_pragmas(conn, *args)
+        if not resets:
+            resets.append(conn)
+            pool.initialize(str(other))
+
+    monkeypatch.setattr(db_connection, "_apply_pragmas", reset_while_connecting)
+    conn = pool.get_connection()
+
+    # The connection opened for the old reservation was dropped and a new
+    # one was made against the database the pool now serves
+    assert conn is not resets[0]
+    with pytest.raises(sqlite3.ProgrammingError):
+        resets[0].execute("SELECT 1")
+    assert conn.execute("PRAGMA database_list").fetchone()[2] == str(other)
+    status = pool.get_pool_status()
+    assert (status['total_connections'], status['active_connections']) == (1, 1)
@@ -0,0 +1,196 @@
+"""Query functions in db_queries against a small MMEX database."""
+
+import gc
+import os
+import sqlite3
+
+import pytest
+
+from mmex_reader import db_queries
+from mmex_reader.db_connection import MAX_CONNECTIONS, _connection_pool
+
+
+@pytest.mark.parametrize("call", [
+    lambda path: db_queries.get_all_accounts(path),
+    lambda path: db_queries.get_transactions(path, "2024-01-01", "2024-12-31"),
+    lambda path: db_queries.calculate_balance_for_account(path, 1),
+])
+def test_deleted_database_is_reported_as_missing(mmex_db, call):
+    error, _ = call(mmex_db)
+    assert error is None
+    os.remove(mmex_db)
+
+    error, result = call(mmex_db)
+    assert result is None
+    assert error == f"Database file not found: {mmex_db}"
+
+
+def _active_connections():
+    return _connection_pool.get_pool_status()['active_connections']
+
+
+def test_chunked_transactions_match_whole_frame(mmex_db):
+    error, whole = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31")
+    assert error is None
+
+    error, chunks = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", chunksize=2)
+    assert error is None
+    with chunks:
+        sizes = [len(chunk) for chunk in chunks]
+    assert sizes == [2, 2]
+    assert sum(sizes) == len(whole)
+    assert _active_connections() == 0
+
+
+def test_closing_chunks_early_returns_connection(mmex_db):
+    error, chunks = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", chunksize=1)
+    assert error is None
+    with chunks:
+        next(chunks)
+        assert _active_connections() == 1
+    assert _active_connections() == 0
+
+
+def test_dropped_chunks_are_released_without_locking(mmex_db):
+    error, chunks = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", chunksize=1)
+    assert error is None
+    del chunks
+    gc.collect()
+    assert _active_connections() == 0
+
+
+def test_closing_chunks_after_pool_closed_is_harmless(mmex_db):
+    error, chunks = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", chunksize=1)
+    assert error is None
+    _connection_pool.close_all()
+    chunks.close()
+    assert _active_connections() == 0
+
+
+def test_exhausted_pool_is_an_error_tuple(mmex_db):
+    held = []
+    try:
+        for _ in range(MAX_CONNECTIONS):
+            error, chunks = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", chunksize=1)
+            assert error is None
+            held.append(chunks)
+        error, chunks = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", chunksize=1)
+        assert chunks is None
+        assert error == "Could not get a database connection from the pool"
+    finally:
+        for chunks in held:
+            chunks.close()
+
+
+@pytest.mark.parametrize("start, end", [("", "2024-12-31"), ("2024-01-01", None)])
+def test_missing_dates_are_rejected(mmex_db, start, end):
+    error, result = db_queries.get_transactions(mmex_db, start, end)
+    assert result is None
+    assert error.startswith("Invalid date string")
+
+
+def test_transactions_carry_their_tags_in_one_row(mmex_db):
+    error, df = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31")
+    assert error is None
+    # One row per live transaction; the deleted TRANSID 5 is left out
+    assert list(df["TRANSID"]) == [1, 2, 3, 4]
+    tags = {row.TRANSID: sorted(filter(None, row.TAGS.split(", "))) for row in df.itertuples()}
+    # TRANSID 3 only has a Payee tag link, which must not be attached to it
+    assert tags == {1: ["a", "b"], 2: ["b"], 3: [], 4: []}
+
+
+def test_transactions_for_one_account(mmex_db):
+    error, df = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31", account_id=2)
+    assert error is None
+    assert list(df["TRANSID"]) == [4]
+    assert list(df["TAGS"]) == [""]
+
+
+@pytest.mark.parametrize("account_id, as_of, expected", [
+    # Initial 100, -10 withdrawal, +200 deposit, -30 transfer out; deleted -999 ignored
+    (1, None, 260.0),
+    # The deposit is timestamped 2024-01-10T09:00:00 and still counts that day
+    (1, "2024-01-10", 290.0),
+    (1, "2024-01-04", 100.0),
+    # Initial 50, +30 transfer in via TOACCOUNTID, -5 withdrawal
+    (2, None, 75.0),
+    (2, "2024-01-15", 80.0),
+    (3, None, 0.0),
+])
+def test_balance_is_one_signed_aggregate(mmex_db, account_id, as_of, expected):
+    error, balance = db_queries.calculate_balance_for_account(mmex_db, account_id, as_of)
+    assert error is None
+    assert balance == pytest.approx(expected)
+
+
+def test_balance_of_unknown_account(mmex_db):
+    error, balance = db_queries.calculate_balance_for_account(mmex_db, 99)
+    assert balance is None
+    assert error == "Account not found: 99"
+
+
+def test_query_on_dead_pooled_connection_is_retried(mmex_db):
+    error, _ = db_queries.get_all_accounts(mmex_db)
+    assert error is None
+    # Kill the idle connection the next checkout will reuse without probing
+    conn = _connection_pool.get_connection()
+    _connection_pool.release_connection(conn)
+    conn.close()
+
+    error, rows = db_queries._run_pooled_query(
+        "SELECT ACCOUNTID FROM ACCOUNTLIST_V1 ORDER BY ACCOUNTID", return_dataframe=False
+    )
+    assert error is None
+    assert [row[0] for row in rows] == [1, 2, 3]
+    status = _connection_pool.get_pool_status()
+    assert (status['total_connections'], status['active_connections']) == (1, 0)
+
+
+def _write_and_touch(path, sql):
+    """Run sql against path and move its mtime forward, as a later save would."""
+    conn = sqlite3.connect(path)
+    conn.execute(sql)
+    conn.commit()
+    conn.close()
+    mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_accounts_are_cached_until_the_file_changes(mmex_db):
+    error, first = db_queries.get_all_accounts(mmex_db)
+    assert error is None
+    first.loc[:, 'ACCOUNTNAME'] = "changed by caller"
+
+    hits = db_queries._get_all_accounts_cached.cache_info().hits
+    error, second = db_queries.get_all_accounts(mmex_db)
+    assert db_queries._get_all_accounts_cached.cache_info().hits == hits + 1
+    # The caller's edits to the first copy do not reach the cache
+    assert sorted(second['ACCOUNTNAME']) == ["Checking", "Savings"]
+
+    _write_and_touch(mmex_db, "INSERT INTO ACCOUNTLIST_V1 VALUES "
+                              "(4, 'Cash', 'Cash', 20, 'Open', 'FALSE', 1)")
+    error, third = db_queries.get_all_accounts(mmex_db)
+    assert error is None
+    assert sorted(third['ACCOUNTNAME']) == ["Cash", "Checking", "Savings"]
+
+
+def test_cached_transactions_are_copies_and_see_new_writes(mmex_db, monkeypatch):
+    error, first = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31")
+    assert error is None
+    first.drop(first.index, inplace=True)
+
+    # Served from the cache: no query runs, and the emptied copy is not it
+    monkeypatch.setattr(db_queries, "_run_pooled_query",
+                        lambda *a, **k: pytest.fail("cache miss"))
+    error, second = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31")
+    assert error is None
+    assert list(second["TRANSID"]) == [1, 2, 3, 4]
+    monkeypatch.undo()
+
+    _write_and_touch(mmex_db, "INSERT INTO CHECKINGACCOUNT_V1 (TRANSID, ACCOUNTID, TOACCOUNTID, "
+                              "PAYEEID, TRANSCODE, TRANSAMOUNT, STATUS, CATEGID, TRANSDATE, "
+                              "DELETEDTIME) VALUES (6, 2, -1, 1, 'Withdrawal', 1, 'R', 1, "
+                              "'2024-02-01', '')")
+    error, third = db_queries.get_transactions(mmex_db, "2024-01-01", "2024-12-31")
+    assert error is None
+    assert list(third["TRANSID"]) == [1, 2, 3, 4, 6]